@@ -1,6 +1,7 @@
 """
 OCR processing endpoints.
 """
+import json
 import os
 import time
 import uuid
@@ -9,6 +10,8 @@ from datetime import datetime
 from typing import Optional, List
 
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 
 from api.schemas.response import OCRResponse, DocumentMetadata, ErrorResponse
 from core.ocr_engine import get_ocr_engine
@@ -523,10 +526,54 @@ async def get_structured_output(
             os.unlink(tmp_path)
 
 
+def _discard_staged(jobs: list):
+    """Delete the temp files of batch jobs that were staged but not processed."""
+    for job in jobs:
+        if isinstance(job, tuple) and os.path.exists(job[0]):
+            os.unlink(job[0])
+
+
+def _process_batch_file(tmp_path: str, filename: str, max_tokens: int) -> dict:
+    """Run OCR and structured output for one saved batch file, then delete it."""
+    try:
+        # Process with OCR
+        engine = get_ocr_engine()
+        result = engine.process_document(tmp_path, max_tokens=max_tokens)
+
+        # Parse and get structured output
+        parser = OutputParser()
+        parsed = parser.parse(result.total_text)
+
+        tables_html = []
+        for page in parsed.pages:
+            tables_html.extend(page.tables_html)
+
+        processor = get_structured_processor()
+        structured = processor.process(result.total_text, tables_html)
+
+        return {
+            "filename": filename,
+            "status": "completed",
+            "result": structured
+        }
+
+    except Exception as e:
+        return {
+            "filename": filename,
+            "status": "error",
+            "error": str(e)
+        }
+
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
 @router.post("/ocr/batch")
 async def process_batch(
     files: List[UploadFile] = File(...),
-    max_tokens: int = Form(default=2048)
+    max_tokens: int = Form(default=2048),
+    stream: bool = Form(default=False)
 ):
     """
     Process multiple documents in batch.
@@ -534,6 +581,7 @@ async def process_batch(
     Args:
         files: List of document files (PDF or images)
         max_tokens: Maximum tokens for generation per document
+        stream: Return one NDJSON line per document as each one finishes
 
     Returns:
         Batch processing results with structured output for each document.
@@ -553,59 +601,57 @@ async def process_batch(
             detail="Maximum 10 files per batch"
         )
 
-    results = []
+    # Each job is either a finished error result or a (tmp_path, filename) to process
+    jobs = []
     supported = ['.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff', '.pdf']
 
-    for file in files:
-        filename = file.filename or "document"
-        extension = os.path.splitext(filename)[1].lower()
-
-        if extension not in supported:
-            results.append({
-                "filename": filename,
-                "status": "error",
-                "error": f"Unsupported file type: {extension}"
-            })
-            continue
-
-        # Save file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=extension) as tmp:
-            content = await file.read()
-            tmp.write(content)
-            tmp_path = tmp.name
-
-        try:
-            # Process with OCR
-            engine = get_ocr_engine()
-            result = engine.process_document(tmp_path, max_tokens=max_tokens)
-
-            # Parse and get structured output
-            parser = OutputParser()
-            parsed = parser.parse(result.total_text)
-
-            tables_html = []
-            for page in parsed.pages:
-                tables_html.extend(page.tables_html)
-
-            processor = get_structured_processor()
-            structured = processor.process(result.total_text, tables_html)
-
-            results.append({
-                "filename": filename,
-                "status": "completed",
-                "result": structured
-            })
-
-        except Exception as e:
-            results.append({
-                "filename": filename,
-                "status": "error",
-                "error": str(e)
-            })
+    try:
+        for file in files:
+            filename = file.filename or "document"
+            extension = os.path.splitext(filename)[1].lower()
+
+            if extension not in supported:
+                jobs.append({
+                    "filename": filename,
+                    "status": "error",
+                    "error": f"Unsupported file type: {extension}"
+                })
+                continue
+
+            # Save file temporarily; recorded before the read so a failed
+            # upload's partial file is removed with the rest
+            with tempfile.NamedTemporaryFile(delete=False, suffix=extension) as tmp:
+                jobs.append((tmp.name, filename))
+                content = await file.read()
+                tmp.write(content)
+    except BaseException:
+        # Nothing will be processed, so drop every file staged so far
+        _discard_staged(jobs)
+        raise
+
+    if stream:
+        def generate_lines():
+            try:
+                for index, job in enumerate(jobs):
+                    item = job if isinstance(job, dict) else _process_batch_file(*job, max_tokens)
+                    jobs[index] = item
+                    yield json.dumps(jsonable_encoder(item)) + "\n"
+            finally:
+                # Client disconnected mid-stream: drop files never processed
+                _discard_staged(jobs)
+
+        # Marked identity so GZipMiddleware passes lines through instead of
+        # holding them in its compression buffer
+        return StreamingResponse(
+            generate_lines(),
+            media_type="application/x-ndjson",
+            headers={"Content-Encoding": "identity"}
+        )
 
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+    results = [
+        job if isinstance(job, dict) else _process_batch_file(*job, max_tokens)
+        for job in jobs
+    ]
 
     # Calculate total processing time
     processing_time_ms = int((time.time() - start_time) * 1000)
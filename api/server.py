@@ -9,6 +9,7 @@ warnings.filterwarnings("ignore", category=DeprecationWarning)
 
 from fastapi import FastAPI, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from datetime import datetime
 
@@ -39,6 +40,9 @@ if settings.api.enable_cors:
     )
 
 
+# Compress JSON responses; OCR results with full text and tables shrink several-fold
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # Add request context middleware for logging
 @app.middleware("http")
 async def add_request_context(request: Request, call_next):
@@ -2,10 +2,13 @@
 Document classification service for auto-detecting document types.
 """
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Pattern, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+# Leading run of plain letters in a keyword regex
+_LEADING_WORD = re.compile(r"[a-z]+")
+
 
 class DocumentType(Enum):
     """Supported document types."""
@@ -37,6 +40,7 @@ class DocumentClassifier:
     def __init__(self):
         """Initialize the document classifier with keyword patterns."""
         self._patterns = self._build_patterns()
+        self._pattern_gates = self._build_pattern_gates()
 
     def _build_patterns(self) -> Dict[DocumentType, Dict]:
         """Build keyword patterns for each document type."""
@@ -179,6 +183,52 @@ class DocumentClassifier:
             }
         }
 
+    def _build_pattern_gates(self) -> Dict[DocumentType, List[Tuple[str, Pattern]]]:
+        """
+        Compile each type's regexes, paired with the word they must start with.
+
+        A pattern can only match when its leading word occurs in the text, so
+        classify() tests that substring before running the regex. Patterns
+        without a plain leading word get an empty gate and always run.
+        """
+        return {
+            doc_type: [
+                (self._leading_literal(pattern), re.compile(pattern))
+                for pattern in config["patterns"]
+            ]
+            for doc_type, config in self._patterns.items()
+        }
+
+    @staticmethod
+    def _leading_literal(pattern: str) -> str:
+        """Return the literal every match of pattern starts with, or ''."""
+        # A top-level alternation means matches may start with anything
+        depth, in_class, escaped = 0, False, False
+        for char in pattern:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif in_class:
+                in_class = char != "]"
+            elif char == "[":
+                in_class = True
+            elif char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+            elif char == "|" and depth == 0:
+                return ""
+
+        match = _LEADING_WORD.match(pattern)
+        if not match:
+            return ""
+        literal = match.group()
+        # A quantifier applies to the last letter only, so it is optional
+        if pattern[match.end():match.end() + 1] in ("?", "*", "+", "{"):
+            literal = literal[:-1]
+        return literal
+
     def classify(self, text: str) -> ClassificationResult:
         """
         Classify a document based on its text content.
@@ -203,9 +253,9 @@ class DocumentClassifier:
                     score += 1.0
                     found_keywords.append(keyword)
 
-            # Score regex patterns
-            for pattern in config["patterns"]:
-                if re.search(pattern, text_lower):
+            # Score regex patterns, skipping those whose leading word is absent
+            for literal, pattern in self._pattern_gates[doc_type]:
+                if literal in text_lower and pattern.search(text_lower):
                     score += 2.0  # Patterns are more specific
 
             # Apply weight
@@ -2,7 +2,7 @@
 Multi-language support for OCR processing.
 """
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Pattern, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -59,6 +59,8 @@ class LanguageDetector:
         """Initialize language detector with patterns."""
         self._patterns = self._build_language_patterns()
         self._script_ranges = self._build_script_ranges()
+        self._word_pattern = re.compile(r"\w+")
+        self._matchers = self._build_matchers()
 
     def _build_language_patterns(self) -> Dict[Language, Dict]:
         """Build characteristic patterns for each language."""
@@ -135,6 +137,29 @@ class LanguageDetector:
             },
         }
 
+    def _build_matchers(self) -> Dict[Language, Tuple[Tuple[str, ...], List[Pattern], List[Pattern]]]:
+        """
+        Precompile the per-language lookups used by detect().
+
+        Common words made only of word characters are matched against a
+        token set built once per call; the rest (e.g. Thai or Hindi words
+        containing combining marks) keep their word-boundary regex.
+        """
+        matchers = {}
+        for lang, config in self._patterns.items():
+            plain_words = tuple(
+                word for word in config["common_words"]
+                if self._word_pattern.fullmatch(word)
+            )
+            word_patterns = [
+                re.compile(rf"\b{re.escape(word)}\b")
+                for word in config["common_words"]
+                if word not in plain_words
+            ]
+            patterns = [re.compile(pattern, re.IGNORECASE) for pattern in config["patterns"]]
+            matchers[lang] = (plain_words, word_patterns, patterns)
+        return matchers
+
     def _build_script_ranges(self) -> Dict[str, Tuple[int, int]]:
         """Build Unicode ranges for different scripts."""
         return {
@@ -172,6 +197,7 @@ class LanguageDetector:
             )
 
         text_lower = text.lower()
+        tokens = set(self._word_pattern.findall(text_lower))
         scores: Dict[str, float] = {}
 
         # Detect script first
@@ -179,16 +205,16 @@ class LanguageDetector:
 
         # Score each language
         for lang, config in self._patterns.items():
+            plain_words, word_patterns, patterns = self._matchers[lang]
             score = 0.0
 
             # Check common words
-            for word in config["common_words"]:
-                if re.search(rf"\b{re.escape(word)}\b", text_lower):
-                    score += 1.0
+            score += sum(1.0 for word in plain_words if word in tokens)
+            score += sum(1.0 for pattern in word_patterns if pattern.search(text_lower))
 
             # Check patterns
-            for pattern in config["patterns"]:
-                matches = re.findall(pattern, text, re.IGNORECASE)
+            for pattern in patterns:
+                matches = pattern.findall(text)
                 score += len(matches) * 0.5
 
             # Boost if script matches
@@ -3,7 +3,7 @@ Semantic field extraction using LLM capabilities.
 """
 import re
 import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Pattern
 from dataclasses import dataclass
 
 
@@ -40,8 +40,8 @@ class SemanticExtractor:
         self._entity_patterns = self._build_entity_patterns()
         self._context_patterns = self._build_context_patterns()
 
-    def _build_entity_patterns(self) -> Dict[str, List[str]]:
-        """Build patterns for entity extraction."""
+    def _build_entity_patterns(self) -> Dict[str, List[Pattern]]:
+        """Build compiled patterns for entity extraction."""
         # Common document labels to exclude from person detection
         self._person_exclusions = {
             'bill to', 'ship to', 'sold to', 'deliver to', 'ship mode', 'second class',
@@ -49,7 +49,7 @@ class SemanticExtractor:
             'grand total', 'sub total', 'thank you', 'terms and', 'notes and',
             'order id', 'invoice number', 'receipt number', 'customer id',
         }
-        return {
+        entity_patterns = {
             "person": [
                 r"\b[A-Z][a-z]+\s+[A-Z][a-z]+\b",  # Names
                 r"(?:Mr\.|Mrs\.|Ms\.|Dr\.)\s+[A-Z][a-z]+",
@@ -79,10 +79,14 @@ class SemanticExtractor:
                 r"\d+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd)",
             ],
         }
+        return {
+            entity_type: [re.compile(p) for p in patterns]
+            for entity_type, patterns in entity_patterns.items()
+        }
 
     def _build_context_patterns(self) -> Dict[str, Dict]:
-        """Build context-aware extraction patterns."""
-        return {
+        """Build context-aware extraction patterns, compiled case-insensitively."""
+        context_patterns = {
             "payment_info": {
                 "triggers": ["payment", "pay", "due", "amount", "total"],
                 "extract": {
@@ -115,6 +119,12 @@ class SemanticExtractor:
                 }
             }
         }
+        for config in context_patterns.values():
+            config["extract"] = {
+                field_name: re.compile(p, re.IGNORECASE)
+                for field_name, p in config["extract"].items()
+            }
+        return context_patterns
 
     def extract(
         self,
@@ -140,7 +150,7 @@ class SemanticExtractor:
         # Extract named entities
         for entity_type, patterns in self._entity_patterns.items():
             for pattern in patterns:
-                matches = re.findall(pattern, text)
+                matches = pattern.findall(text)
                 for match in matches:
                     # Filter out false positives for person entities
                     if entity_type == "person":
@@ -161,7 +171,7 @@ class SemanticExtractor:
             # Check if context is relevant
             if any(trigger in text_lower for trigger in config["triggers"]):
                 for field_name, pattern in config["extract"].items():
-                    match = re.search(pattern, text, re.IGNORECASE)
+                    match = pattern.search(text)
                     if match:
                         value = match.group(1).strip()
                         fields[field_name] = SemanticField(
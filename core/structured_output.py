@@ -2,16 +2,35 @@
 Enhanced structured output processor for OCR results.
 Combines classification, extraction, and parsing into a unified output format.
 """
+import copy
+import hashlib
 import re
-from typing import Dict, List, Any, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Pattern, Tuple
 from dataclasses import dataclass, asdict
 
 from core.document_classifier import get_document_classifier, DocumentType
 from core.semantic_extractor import get_semantic_extractor
-from core.language_support import get_language_detector
+from core.language_support import get_language_detector, Language
 from core.field_extractor import FieldExtractor
 from core.output_parser import OutputParser
 
+# lxml parses table HTML in C; BeautifulSoup stays as the fallback
+try:
+    import lxml.html
+    from lxml.etree import ParserError
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# Number of distinct (text, tables) inputs whose results are kept per processor
+RESULT_CACHE_SIZE = 32
+
+# Upper bound on the OCR characters held by cached results; each result keeps
+# its input in "raw", so long multi-page documents are evicted first
+RESULT_CACHE_CHARS = 8 * 1024 * 1024
+
 
 @dataclass
 class LineItem:
@@ -46,11 +65,21 @@ class StructuredOutputProcessor:
         self.language_detector = get_language_detector()
         self.field_extractor = FieldExtractor()
         self.output_parser = OutputParser()
+        self._common_patterns, self._doc_patterns = self._build_field_patterns()
+        self._sku_pattern = re.compile(r'([A-Z]+-[A-Z]+-\d+)')
+        # digest -> (result, input size in characters), least recently used first
+        self._result_cache: OrderedDict = OrderedDict()
+        self._cache_chars = 0
+        self._cache_lock = threading.Lock()
 
     def process(self, text: str, tables_html: List[str] = None) -> Dict[str, Any]:
         """
         Process OCR text into structured output.
 
+        Results are cached per processor on a digest of the text and tables,
+        so retries of the same document skip the pipeline. Each call gets its
+        own copy; construct a new processor to start with an empty cache.
+
         Args:
             text: Raw OCR text
             tables_html: Optional list of HTML tables
@@ -58,6 +87,58 @@ class StructuredOutputProcessor:
         Returns:
             Structured output dictionary
         """
+        cache_key, size = self._cache_key(text, tables_html)
+        with self._cache_lock:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                return copy.deepcopy(cached[0])
+
+        result = self._process(text, tables_html)
+        if size > RESULT_CACHE_CHARS:
+            return result
+
+        # The cache keeps its own copy; the caller gets the fresh result
+        stored = copy.deepcopy(result)
+        with self._cache_lock:
+            if cache_key not in self._result_cache:
+                self._result_cache[cache_key] = (stored, size)
+                self._cache_chars += size
+                while (
+                    len(self._result_cache) > RESULT_CACHE_SIZE
+                    or self._cache_chars > RESULT_CACHE_CHARS
+                ):
+                    _, (_, evicted_size) = self._result_cache.popitem(last=False)
+                    self._cache_chars -= evicted_size
+        return result
+
+    @staticmethod
+    def _cache_key(text: str, tables_html: Optional[List[str]]) -> Tuple[bytes, int]:
+        """SHA-256 of the text and tables, and their combined length in characters."""
+        digest = hashlib.sha256()
+        size = 0
+        for part in (text or "", *(tables_html or ())):
+            # Length prefixes keep ("ab", "c") and ("a", "bc") apart
+            encoded = part.encode("utf-8", "surrogatepass")
+            digest.update(b"%d:" % len(encoded))
+            digest.update(encoded)
+            size += len(part)
+        return digest.digest(), size
+
+    def _process(self, text: str, tables_html: Optional[List[str]]) -> Dict[str, Any]:
+        """Run the full classification and extraction pipeline."""
+        # Blank text carries no signal, so skip every detector
+        if not text or text.isspace():
+            return {
+                "document_type": DocumentType.UNKNOWN.value,
+                "confidence": 0.0,
+                "language": Language.UNKNOWN.value,
+                "extracted_fields": {},
+                "line_items": self._parse_tables(tables_html),
+                "entities": [],
+                "raw": {"text": text, "tables_html": tables_html or [], "pages": []}
+            }
+
         # Classify document
         classification = self.classifier.classify(text)
 
@@ -72,11 +153,7 @@ class StructuredOutputProcessor:
         entities = semantic_result.entities
 
         # Parse line items from tables
-        line_items = []
-        if tables_html:
-            for table in tables_html:
-                items = self._parse_line_items(table)
-                line_items.extend(items)
+        line_items = self._parse_tables(tables_html)
 
         # Build raw data
         parsed = self.output_parser.parse(text)
@@ -96,10 +173,10 @@ class StructuredOutputProcessor:
             "raw": raw
         }
 
-    def _extract_fields(self, text: str, doc_type: DocumentType) -> Dict[str, Any]:
-        """Extract fields based on document type."""
-        fields = {}
-
+    def _build_field_patterns(
+        self
+    ) -> Tuple[Dict[str, List[Pattern]], Dict[DocumentType, Dict[str, List[Pattern]]]]:
+        """Build compiled field patterns, common and per document type."""
         # Common patterns for all documents
         common_patterns = {
             "date": [
@@ -263,15 +340,30 @@ class StructuredOutputProcessor:
             },
         }
 
+        def compile_all(table: Dict[str, List[str]]) -> Dict[str, List[Pattern]]:
+            return {
+                name: [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in patterns]
+                for name, patterns in table.items()
+            }
+
+        return (
+            compile_all(common_patterns),
+            {doc_type: compile_all(table) for doc_type, table in doc_patterns.items()},
+        )
+
+    def _extract_fields(self, text: str, doc_type: DocumentType) -> Dict[str, Any]:
+        """Extract fields based on document type."""
+        fields = {}
+
         # Extract common fields
-        for field_name, patterns in common_patterns.items():
+        for field_name, patterns in self._common_patterns.items():
             value = self._extract_first_match(text, patterns)
             if value:
                 fields[field_name] = value.strip()
 
         # Extract document-specific fields
-        if doc_type in doc_patterns:
-            for field_name, patterns in doc_patterns[doc_type].items():
+        if doc_type in self._doc_patterns:
+            for field_name, patterns in self._doc_patterns[doc_type].items():
                 value = self._extract_first_match(text, patterns)
                 if value:
                     # Clean up the value
@@ -284,10 +376,13 @@ class StructuredOutputProcessor:
 
         return fields
 
-    def _extract_first_match(self, text: str, patterns: List[str]) -> Optional[str]:
+    def _extract_first_match(self, text: str, patterns: List[Pattern]) -> Optional[str]:
         """Extract first matching value from patterns."""
+        # Patterns are searched one at a time on purpose: fusing them into a
+        # single lookahead alternation keeps priority order but defeats re's
+        # literal-prefix scan and benchmarks 2-3x slower on OCR-sized text.
         for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+            match = pattern.search(text)
             if match:
                 return match.group(1)
         return None
@@ -306,32 +401,60 @@ class StructuredOutputProcessor:
 
         return result
 
-    def _parse_line_items(self, table_html: str) -> List[Dict]:
-        """Parse line items from HTML table."""
+    def _parse_tables(self, tables_html: Optional[List[str]]) -> List[Dict]:
+        """Parse line items from every table."""
+        line_items = []
+        if tables_html:
+            for table in tables_html:
+                line_items.extend(self._parse_line_items(table))
+        return line_items
+
+    def _table_rows(self, table_html: str) -> List[List[str]]:
+        """Extract the stripped text of every cell, row by row."""
+        if HAS_LXML:
+            try:
+                root = lxml.html.fromstring(table_html)
+            except (ParserError, ValueError):
+                # Empty markup, or a str carrying an XML encoding declaration;
+                # BeautifulSoup below accepts both
+                root = None
+            if root is not None:
+                return [
+                    [
+                        "".join(s.strip() for s in cell.itertext() if s.strip())
+                        for cell in row.iter('td', 'th')
+                    ]
+                    for row in root.iter('tr')
+                ]
+
         from bs4 import BeautifulSoup
 
-        items = []
         soup = BeautifulSoup(table_html, 'html.parser')
+        return [
+            [cell.get_text(strip=True) for cell in row.find_all(['td', 'th'])]
+            for row in soup.find_all('tr')
+        ]
+
+    def _parse_line_items(self, table_html: str) -> List[Dict]:
+        """Parse line items from HTML table."""
+        items = []
 
         # Find all rows
-        rows = soup.find_all('tr')
+        rows = self._table_rows(table_html)
         if len(rows) < 2:
             return items
 
         # Get headers
-        header_row = rows[0]
-        headers = [th.get_text(strip=True).lower() for th in header_row.find_all(['th', 'td'])]
+        headers = [cell.lower() for cell in rows[0]]
 
         # Parse data rows
-        for row in rows[1:]:
-            cells = row.find_all(['td', 'th'])
+        for cells in rows[1:]:
             if len(cells) != len(headers):
                 continue
 
             item = {}
-            for i, cell in enumerate(cells):
+            for i, cell_text in enumerate(cells):
                 header = headers[i] if i < len(headers) else f"col_{i}"
-                cell_text = cell.get_text(strip=True)
 
                 # Map common column names
                 if header in ['item', 'description', 'product']:
@@ -341,7 +464,7 @@ class StructuredOutputProcessor:
                     if len(desc_parts) > 1:
                         # Try to extract category and SKU
                         extra = desc_parts[1] if len(desc_parts) > 1 else ""
-                        sku_match = re.search(r'([A-Z]+-[A-Z]+-\d+)', extra)
+                        sku_match = self._sku_pattern.search(extra)
                         if sku_match:
                             item['sku'] = sku_match.group(1)
                             category = extra.replace(sku_match.group(1), '').strip().strip(',').strip()
@@ -1,7 +1,13 @@
 """
 Workflow/Pipeline engine for document processing automation.
 """
+import asyncio
+import json
+import os
+import sys
+import time
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Any, List, Optional, Callable
 from enum import Enum
 from dataclasses import dataclass, field
@@ -9,6 +15,21 @@ from datetime import datetime
 
 from utils.logger import app_logger
 
+# orjson serializes plain dicts several times faster; json is the fallback
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Slotted dataclasses need Python 3.10+; CI still runs 3.9
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _call_handler(handler: Callable, context: Dict[str, Any], config: Dict[str, Any]) -> Any:
+    """Invoke a handler; module level so it can be sent to a worker process."""
+    return handler(context, config)
+
 
 class StepStatus(str, Enum):
     PENDING = "pending"
@@ -18,7 +39,7 @@ class StepStatus(str, Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StepResult:
     """Result of a workflow step."""
     status: StepStatus
@@ -27,7 +48,7 @@ class StepResult:
     duration_ms: int = 0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WorkflowStep:
     """Definition of a workflow step."""
     name: str
@@ -35,9 +56,10 @@ class WorkflowStep:
     config: Dict[str, Any] = field(default_factory=dict)
     condition: Optional[str] = None  # Condition to run this step
     on_failure: str = "fail"  # fail, skip, retry
+    depends_on: Optional[List[str]] = None  # None means every earlier step
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Workflow:
     """Workflow definition."""
     id: str
@@ -46,7 +68,7 @@ class Workflow:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WorkflowExecution:
     """Execution instance of a workflow."""
     id: str
@@ -64,6 +86,8 @@ class WorkflowEngine:
     def __init__(self):
         self.workflows: Dict[str, Workflow] = {}
         self.handlers: Dict[str, Callable] = {}
+        self._process_handlers: set = set()
+        self._process_pool: Optional[ProcessPoolExecutor] = None
         self._register_default_handlers()
 
     def _register_default_handlers(self):
@@ -78,9 +102,34 @@ class WorkflowEngine:
             "send_notification": self._handle_send_notification,
         }
 
-    def register_handler(self, name: str, handler: Callable):
-        """Register a custom workflow handler."""
+    def register_handler(self, name: str, handler: Callable, cpu_bound: bool = False):
+        """
+        Register a custom workflow handler.
+
+        Args:
+            name: Handler name used by workflow steps
+            handler: Callable taking (context, config)
+            cpu_bound: Run in a worker process under execute_async. The
+                handler, context and config must be picklable, so use a
+                module-level function.
+        """
         self.handlers[name] = handler
+        if cpu_bound:
+            self._process_handlers.add(name)
+        else:
+            self._process_handlers.discard(name)
+
+    def shutdown(self):
+        """Shut down the worker process pool, waiting for running steps."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True)
+            self._process_pool = None
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Create the worker process pool on first use."""
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self._process_pool
 
     def create_workflow(
         self,
@@ -102,10 +151,12 @@ class WorkflowEngine:
         workflow_steps = [
             WorkflowStep(
                 name=step.get("name", f"step_{i}"),
-                handler=step["handler"],
+                # Interned so handler lookups hit the identity fast path
+                handler=sys.intern(step["handler"]),
                 config=step.get("config", {}),
                 condition=step.get("condition"),
-                on_failure=step.get("on_failure", "fail")
+                on_failure=step.get("on_failure", "fail"),
+                depends_on=step.get("depends_on")
             )
             for i, step in enumerate(steps)
         ]
@@ -208,14 +259,183 @@ class WorkflowEngine:
 
         return execution
 
+    async def execute_async(
+        self,
+        workflow_id: str,
+        context: Dict[str, Any],
+        max_concurrency: Optional[int] = None
+    ) -> WorkflowExecution:
+        """
+        Execute a workflow, running independent steps concurrently.
+
+        Steps are grouped into layers by depends_on; the steps of a layer
+        run in worker threads together and their outputs are merged into
+        the context, in definition order, once the whole layer finishes.
+        Steps without depends_on wait for every earlier step, so existing
+        workflows run exactly as with execute().
+
+        Args:
+            workflow_id: ID of workflow to execute
+            context: Initial context data
+            max_concurrency: Maximum steps running at once (default: CPU count)
+
+        Returns:
+            Workflow execution result
+        """
+        if workflow_id not in self.workflows:
+            raise ValueError(f"Workflow not found: {workflow_id}")
+
+        workflow = self.workflows[workflow_id]
+        layers = self._build_layers(workflow)
+        execution_id = f"exec_{uuid.uuid4().hex[:12]}"
+
+        execution = WorkflowExecution(
+            id=execution_id,
+            workflow_id=workflow_id,
+            status=StepStatus.RUNNING,
+            context=context.copy()
+        )
+
+        app_logger.info(
+            "Starting workflow execution",
+            execution_id=execution_id,
+            workflow_id=workflow_id,
+            layers=len(layers)
+        )
+
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency or os.cpu_count() or 1)
+
+        async def run_step(step: WorkflowStep) -> StepResult:
+            async with semaphore:
+                if step.handler in self._process_handlers:
+                    return await self._execute_step_in_process(step, execution.context)
+                return await loop.run_in_executor(
+                    None, self._execute_step, step, execution.context
+                )
+
+        try:
+            for layer in layers:
+                # Check conditions against the context before the layer runs
+                runnable = []
+                for step in layer:
+                    if step.condition and not self._evaluate_condition(step.condition, execution.context):
+                        execution.step_results[step.name] = StepResult(
+                            status=StepStatus.SKIPPED
+                        )
+                    else:
+                        runnable.append(step)
+
+                results = await asyncio.gather(*(run_step(step) for step in runnable))
+
+                for step, result in zip(runnable, results):
+                    execution.step_results[step.name] = result
+
+                    # Handle failure
+                    if result.status == StepStatus.FAILED:
+                        if step.on_failure == "fail":
+                            execution.status = StepStatus.FAILED
+                        continue
+
+                    # Update context with output
+                    if result.output:
+                        execution.context[f"{step.name}_output"] = result.output
+
+                if execution.status == StepStatus.FAILED:
+                    break
+
+            if execution.status == StepStatus.RUNNING:
+                execution.status = StepStatus.COMPLETED
+
+        except Exception as e:
+            app_logger.error(
+                "Workflow execution failed",
+                execution_id=execution_id,
+                error=str(e)
+            )
+            execution.status = StepStatus.FAILED
+
+        execution.completed_at = datetime.utcnow()
+
+        app_logger.info(
+            "Workflow execution completed",
+            execution_id=execution_id,
+            status=execution.status.value
+        )
+
+        return execution
+
+    def _build_layers(self, workflow: Workflow) -> List[List[WorkflowStep]]:
+        """Group steps into layers whose steps only depend on earlier layers."""
+        layer_of: Dict[str, int] = {}
+        layers: List[List[WorkflowStep]] = []
+
+        for step in workflow.steps:
+            if step.depends_on is None:
+                index = len(layers)
+            else:
+                unknown = [name for name in step.depends_on if name not in layer_of]
+                if unknown:
+                    raise ValueError(
+                        f"Step {step.name} depends on unknown or later steps: {', '.join(unknown)}"
+                    )
+                index = max((layer_of[name] + 1 for name in step.depends_on), default=0)
+
+            if index == len(layers):
+                layers.append([])
+            layers[index].append(step)
+            layer_of[step.name] = index
+
+        return layers
+
+    def to_dict(self, workflow: Workflow) -> Dict[str, Any]:
+        """
+        Convert a workflow to a dictionary of JSON-native values.
+
+        Args:
+            workflow: Workflow to convert
+
+        Returns:
+            Dictionary representation
+        """
+        return {
+            "id": workflow.id,
+            "name": workflow.name,
+            "steps": [
+                {
+                    "name": step.name,
+                    "handler": step.handler,
+                    "config": step.config,
+                    "condition": step.condition,
+                    "on_failure": step.on_failure,
+                    "depends_on": step.depends_on
+                }
+                for step in workflow.steps
+            ],
+            "created_at": workflow.created_at.isoformat()
+        }
+
+    def to_json(self, workflow: Workflow) -> str:
+        """
+        Serialize a workflow to a JSON string.
+
+        Args:
+            workflow: Workflow to serialize
+
+        Returns:
+            JSON string
+        """
+        data = self.to_dict(workflow)
+        if HAS_ORJSON:
+            return orjson.dumps(data).decode()
+        return json.dumps(data, separators=(",", ":"))
+
     def _execute_step(
         self,
         step: WorkflowStep,
         context: Dict[str, Any]
     ) -> StepResult:
         """Execute a single workflow step."""
-        import time
-
         if step.handler not in self.handlers:
             return StepResult(
                 status=StepStatus.FAILED,
@@ -244,6 +464,37 @@ class WorkflowEngine:
                 duration_ms=duration_ms
             )
 
+    async def _execute_step_in_process(
+        self,
+        step: WorkflowStep,
+        context: Dict[str, Any]
+    ) -> StepResult:
+        """Execute a CPU-bound step in the worker process pool."""
+        handler = self.handlers[step.handler]
+        loop = asyncio.get_running_loop()
+        start_time = time.time()
+
+        try:
+            output = await loop.run_in_executor(
+                self._get_process_pool(), _call_handler, handler, context, step.config
+            )
+            duration_ms = int((time.time() - start_time) * 1000)
+
+            return StepResult(
+                status=StepStatus.COMPLETED,
+                output=output,
+                duration_ms=duration_ms
+            )
+
+        except Exception as e:
+            duration_ms = int((time.time() - start_time) * 1000)
+
+            return StepResult(
+                status=StepStatus.FAILED,
+                error=str(e),
+                duration_ms=duration_ms
+            )
+
     def _evaluate_condition(self, condition: str, context: Dict[str, Any]) -> bool:
         """Evaluate a step condition."""
         try:
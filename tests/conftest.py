@@ -9,7 +9,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_ocr_text():
     """Sample OCR output text for testing."""
     return """
@@ -38,6 +38,17 @@ def sample_ocr_text():
     """
 
 
+@pytest.fixture(scope="session")
+def invoice_docs():
+    """Single-field invoice fragments shared across extraction tests."""
+    return {
+        "number": "Invoice Number: INV-2024-001",
+        "date": "Invoice Date: 2024-01-15",
+        "total": "Total Amount: $1,250.00",
+        "tax": "Tax Amount: $125.00",
+    }
+
+
 @pytest.fixture
 def sample_image():
     """Create a sample test image."""
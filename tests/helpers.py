@@ -0,0 +1,8 @@
+"""
+Plain helper functions shared by test modules.
+"""
+
+
+def has_any(container, *keys) -> bool:
+    """Return True if any of the keys is present, stopping at the first hit."""
+    return any(key in container for key in keys)
@@ -2,12 +2,18 @@
 import pytest
 import json
 import base64
+import concurrent.futures
 from io import BytesIO
 from unittest.mock import patch, MagicMock
 from PIL import Image
 
 from api.server import app
 from fastapi.testclient import TestClient
+from core.document_classifier import DocumentClassifier, get_document_classifier
+from core.semantic_extractor import SemanticExtractor, get_semantic_extractor
+from core.language_support import LanguageDetector, MultiLanguageProcessor
+from core.output_parser import OutputParser
+from core.field_extractor import FieldExtractor
 
 
 @pytest.fixture
@@ -79,13 +85,11 @@ class TestDocumentProcessing:
 
     def test_document_classification_flow(self, client):
         """Test document classification in processing flow."""
-        from core.document_classifier import get_document_classifier
         classifier = get_document_classifier()
         assert classifier is not None
 
     def test_semantic_extraction_flow(self, client):
         """Test semantic extraction in processing flow."""
-        from core.semantic_extractor import get_semantic_extractor
         extractor = get_semantic_extractor()
         assert extractor is not None
 
@@ -95,12 +99,6 @@ class TestEndToEndWorkflow:
 
     def test_ocr_pipeline_components(self):
         """Test that all OCR pipeline components are importable."""
-        from core.document_classifier import DocumentClassifier
-        from core.semantic_extractor import SemanticExtractor
-        from core.language_support import LanguageDetector
-        from core.output_parser import OutputParser
-        from core.field_extractor import FieldExtractor
-
         # Verify components can be instantiated
         classifier = DocumentClassifier()
         extractor = SemanticExtractor()
@@ -116,9 +114,6 @@ class TestEndToEndWorkflow:
 
     def test_classification_to_extraction_flow(self):
         """Test flow from classification to extraction."""
-        from core.document_classifier import DocumentClassifier
-        from core.semantic_extractor import SemanticExtractor
-
         # Sample invoice text
         text = """
         INVOICE
@@ -140,8 +135,6 @@ class TestEndToEndWorkflow:
 
     def test_multilingual_processing_flow(self):
         """Test multilingual document processing."""
-        from core.language_support import MultiLanguageProcessor
-
         processor = MultiLanguageProcessor()
 
         # English text - use more words for better detection
@@ -185,8 +178,6 @@ class TestConcurrency:
 
     def test_multiple_health_checks(self, client):
         """Test multiple concurrent health checks."""
-        import concurrent.futures
-
         def check_health():
             return client.get("/api/v1/health").status_code
 
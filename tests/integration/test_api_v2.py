@@ -5,6 +5,8 @@ import pytest
 import io
 from PIL import Image
 
+from tests.helpers import has_any
+
 try:
     from fastapi.testclient import TestClient
     from api.server import app
@@ -212,7 +214,7 @@ class TestExtractEntitiesEndpoint:
 
         # Check for expected entity types
         entity_types = [e["type"] for e in data["entities"]]
-        assert "money" in entity_types or "email" in entity_types
+        assert has_any(entity_types, "money", "email")
 
     def test_extract_entities_no_input(self, client):
         """Test extract-entities requires file or text."""
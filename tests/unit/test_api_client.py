@@ -0,0 +1,430 @@
+"""
+Unit tests for the UI's OCR API client.
+"""
+import asyncio
+import dataclasses
+import io
+import socket
+import threading
+from collections import OrderedDict
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+import ui.api_client as api_client_module
+from ui.api_client import AsyncOCRAPIClient, OCRAPIClient, get_api_client
+
+
+@pytest.fixture
+def client():
+    """Client whose session never touches the network."""
+    client = OCRAPIClient(base_url="http://api.test", api_key="secret-key")
+    with patch.object(client._session, "request") as mock_request:
+        mock_request.return_value = MagicMock(status_code=200, content=b'{"status": "ok"}')
+        yield client
+    client.close()
+
+
+@pytest.fixture
+def sample_file(tmp_path):
+    """Small document on disk for upload methods."""
+    path = tmp_path / "doc.png"
+    path.write_bytes(b"\x89PNG fake")
+    return str(path)
+
+
+class TestOCRAPIClient:
+    """Tests for OCRAPIClient."""
+
+    @pytest.mark.unit
+    def test_requests_use_pooled_session(self, client):
+        """Test calls go through the client's session."""
+        result = client.health_check()
+
+        assert result.success is True
+        assert result.data == {"status": "ok"}
+        kwargs = client._session.request.call_args.kwargs
+        assert kwargs["url"] == "http://api.test/api/v1/health"
+
+    @pytest.mark.unit
+    def test_pooled_sockets_use_tcp_keepalive(self, client):
+        """Test pooled connections enable keep-alive probes on top of TCP_NODELAY."""
+        adapter = client._session.get_adapter("http://api.test")
+        options = adapter.poolmanager.connection_pool_kw["socket_options"]
+
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("call,read_timeout", [
+        (lambda c, f: c.health_check(), 10),
+        (lambda c, f: c.classify_document(f), 300),
+        (lambda c, f: c.process_batch([f]), 600),
+    ], ids=["health", "upload", "batch"])
+    def test_per_endpoint_timeouts(self, client, sample_file, call, read_timeout):
+        """Test probes fail fast while uploads keep the long read budget."""
+        call(client, sample_file)
+
+        assert client._session.request.call_args.kwargs["timeout"] == (5, read_timeout)
+
+    @pytest.mark.unit
+    def test_auth_headers_set_on_session(self, client):
+        """Test auth headers are configured once on the session, not per call."""
+        client.health_check()
+
+        assert client._session.headers["Authorization"] == "Bearer secret-key"
+        assert client._session.headers["Accept"] == "application/json"
+        assert client._session.request.call_args.kwargs["headers"] is None
+
+    @pytest.mark.unit
+    def test_upload_streams_multipart(self, client, sample_file):
+        """Test uploads stream a multipart body with fields and the file."""
+        pytest.importorskip("requests_toolbelt")
+        sent = {}
+
+        def capture(**kwargs):
+            sent.update(kwargs, body=kwargs["data"].to_string())
+            return MagicMock(status_code=200, content=b"{}")
+
+        client._session.request.side_effect = capture
+
+        client.process_document_v2(sample_file, max_tokens=512)
+
+        body = sent["body"]
+        assert sent["files"] is None
+        assert sent["headers"]["Content-Type"].startswith("multipart/form-data")
+        assert b'name="max_tokens"\r\n\r\n512' in body
+        assert b'filename="doc.png"' in body
+
+    @pytest.mark.unit
+    def test_upload_without_toolbelt(self, client, sample_file, monkeypatch):
+        """Test uploads fall back to requests' files= encoding."""
+        monkeypatch.setattr(api_client_module, "HAS_TOOLBELT", False)
+
+        client.classify_document(sample_file)
+
+        files = client._session.request.call_args.kwargs["files"]
+        assert files["file"][0] == "doc.png"
+
+    @pytest.mark.unit
+    def test_upload_accepts_bytes_and_open_files(self, client, sample_file, monkeypatch):
+        """Test uploads take named bytes or an open file, keeping the extension."""
+        monkeypatch.setattr(api_client_module, "HAS_TOOLBELT", False)
+        sent = []
+
+        def capture(**kwargs):
+            name, f = kwargs["files"]["file"]
+            sent.append((name, f.read()))
+            return MagicMock(status_code=200, content=b"{}")
+
+        client._session.request.side_effect = capture
+
+        client.detect_language(("scan.pdf", b"raw bytes"))
+        with open(sample_file, "rb") as f:
+            f.read()
+            client.extract_entities(f)
+            assert not f.closed
+
+        assert sent == [("scan.pdf", b"raw bytes"), ("doc.png", b"\x89PNG fake")]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("source", [
+        b"raw bytes",
+        ("document", b"raw bytes"),
+        ("notes.txt", b"raw bytes"),
+        io.BytesIO(b"raw bytes"),
+    ], ids=["bare-bytes", "no-extension", "unsupported", "unnamed-file"])
+    def test_upload_rejects_unnamed_sources(self, client, source):
+        """Test in-memory uploads without a supported extension never reach the server."""
+        with pytest.raises(ValueError):
+            client.detect_language(source)
+
+        client._session.request.assert_not_called()
+
+    @pytest.mark.unit
+    def test_batch_closes_handles_on_open_failure(self, client, sample_file):
+        """Test already-opened batch files are closed if a later path is missing."""
+        opened = []
+        real_open = open
+
+        def tracking_open(*args, **kwargs):
+            handle = real_open(*args, **kwargs)
+            opened.append(handle)
+            return handle
+
+        with patch("builtins.open", side_effect=tracking_open):
+            with pytest.raises(FileNotFoundError):
+                client.process_batch([sample_file, sample_file + ".missing"])
+
+        assert len(opened) == 1
+        assert opened[0].closed
+        client._session.request.assert_not_called()
+
+    @pytest.mark.unit
+    def test_analyze_calls_enrichment_endpoints(self, client, sample_file):
+        """Test analyze uploads to all three enrichment endpoints."""
+        result = client.analyze(sample_file)
+
+        assert set(result) == {"classification", "language", "entities"}
+        assert all(r.success for r in result.values())
+        urls = {call.kwargs["url"] for call in client._session.request.call_args_list}
+        assert urls == {
+            "http://api.test/api/v1/classify",
+            "http://api.test/api/v1/detect-language",
+            "http://api.test/api/v1/extract-entities",
+        }
+
+    @pytest.mark.unit
+    def test_repeated_upload_served_from_cache(self, client, sample_file):
+        """Test an unchanged file is uploaded once per endpoint and form data."""
+        first = client.classify_document(sample_file)
+        first.data["status"] = "mutated"
+        second = client.classify_document(sample_file)
+
+        assert second.data == {"status": "ok"}
+        assert client._session.request.call_count == 1
+
+        client.process_document_v2(sample_file, max_tokens=512)
+        client.process_document_v2(sample_file, max_tokens=1024)
+
+        assert client._session.request.call_count == 3
+
+    @pytest.mark.unit
+    def test_cache_keyed_on_content(self, client, sample_file):
+        """Test editing the file invalidates its cached response."""
+        client.classify_document(sample_file)
+        with open(sample_file, "ab") as f:
+            f.write(b"more")
+        client.classify_document(sample_file)
+
+        assert client._session.request.call_count == 2
+
+    @pytest.mark.unit
+    def test_webhook_and_failed_uploads_not_cached(self, client, sample_file):
+        """Test webhook requests and errors always reach the server."""
+        client.process_document_v2(sample_file, webhook_url="https://hook.test")
+        client.process_document_v2(sample_file, webhook_url="https://hook.test")
+        client._session.request.return_value = MagicMock(status_code=503, content=b"{}")
+        client.detect_language(sample_file)
+        client.detect_language(sample_file)
+
+        assert client._session.request.call_count == 4
+
+    @pytest.mark.unit
+    def test_error_response(self, client):
+        """Test non-200 responses surface the API detail."""
+        client._session.request.return_value = MagicMock(
+            status_code=503, content=b'{"detail": "Model loading"}'
+        )
+
+        result = client.health_check()
+
+        assert result.success is False
+        assert result.error == "API Error (503): Model loading"
+
+    @pytest.mark.unit
+    def test_non_json_error_response(self, client):
+        """Test non-JSON error bodies are reported as text, not as a crash."""
+        client._session.request.return_value = MagicMock(
+            status_code=502, content=b"<html>Bad Gateway</html>", text="<html>Bad Gateway</html>"
+        )
+
+        result = client.health_check()
+
+        assert result.status_code == 502
+        assert result.error == "API Error (502): <html>Bad Gateway</html>"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_json_decoders_agree(self, client, monkeypatch, has_orjson):
+        """Test responses decode the same with orjson and the json fallback."""
+        if has_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(api_client_module, "HAS_ORJSON", has_orjson)
+
+        assert client.health_check().data == {"status": "ok"}
+
+    @pytest.mark.unit
+    def test_response_is_immutable(self, client):
+        """Test responses are frozen so they can be shared between callers."""
+        result = client.health_check()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.success = False
+
+    @pytest.mark.unit
+    def test_context_manager_closes_session(self):
+        """Test leaving the context closes pooled connections."""
+        client = OCRAPIClient(base_url="http://api.test")
+        client._session = MagicMock()
+
+        with client:
+            pass
+
+        client._session.close.assert_called_once()
+
+
+class TestGetAPIClient:
+    """Tests for the shared client accessor."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_clients(self, monkeypatch):
+        """Isolate the shared client cache per test."""
+        clients = OrderedDict()
+        monkeypatch.setattr(api_client_module, "_api_clients", clients)
+        yield
+        for client in clients.values():
+            client.close()
+
+    @pytest.mark.unit
+    def test_reused_per_target(self):
+        """Test each target keeps its client while callers switch between them."""
+        first = get_api_client(base_url="http://api.test", api_key="k")
+        other = get_api_client(base_url="http://other.test", api_key="k")
+        again = get_api_client(base_url="http://api.test", api_key="k")
+
+        assert again is first
+        assert other is not first
+        assert get_api_client() is first
+
+    @pytest.mark.unit
+    def test_least_recent_client_evicted(self, monkeypatch):
+        """Test the cache stays bounded and closes evicted clients."""
+        monkeypatch.setattr(api_client_module, "MAX_SHARED_CLIENTS", 2)
+        first = get_api_client(base_url="http://a.test")
+        first._session = MagicMock()
+        get_api_client(base_url="http://b.test")
+        get_api_client(base_url="http://c.test")
+
+        first._session.close.assert_called_once()
+        assert get_api_client(base_url="http://a.test") is not first
+
+    @pytest.mark.unit
+    def test_concurrent_callers_share_one_client(self):
+        """Test racing threads all receive the same client instance."""
+        barrier = threading.Barrier(8)
+        clients = []
+
+        def worker():
+            barrier.wait()
+            clients.append(get_api_client(base_url="http://api.test", api_key="k"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(c) for c in clients}) == 1
+
+
+class TestAsyncOCRAPIClient:
+    """Tests for AsyncOCRAPIClient."""
+
+    @pytest.mark.unit
+    def test_process_batch_concurrent(self, sample_file):
+        """Test batch processing issues one request per file, in order."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.url.path)
+            return httpx.Response(200, json={"n": len(seen)})
+
+        async def run():
+            async with AsyncOCRAPIClient(base_url="http://api.test") as client:
+                await client._client.aclose()
+                client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                return await client.process_batch([sample_file, sample_file])
+
+        results = asyncio.run(run())
+
+        assert [r.success for r in results] == [True, True]
+        assert seen == ["/api/v1/ocr", "/api/v1/ocr"]
+
+    @pytest.mark.unit
+    def test_retries_rate_limited_upload(self, sample_file, monkeypatch):
+        """Test 429 responses are resent with the file rewound."""
+        monkeypatch.setattr(api_client_module, "RETRY_BACKOFF", 0)
+        bodies = []
+
+        def handler(request):
+            bodies.append(request.read())
+            status = 429 if len(bodies) < 3 else 200
+            return httpx.Response(status, json={"attempt": len(bodies)})
+
+        async def run():
+            async with AsyncOCRAPIClient(base_url="http://api.test") as client:
+                await client._client.aclose()
+                client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                return await client.classify_document(sample_file)
+
+        result = asyncio.run(run())
+
+        assert result.success is True
+        assert result.data == {"attempt": 3}
+        assert len(bodies) == 3
+        assert all(b"\x89PNG fake" in body for body in bodies)
+
+    @pytest.mark.unit
+    def test_timeouts_fail_fast(self, sample_file):
+        """Test connects and health probes use the short timeouts, uploads the long one."""
+        timeouts = {}
+
+        def handler(request):
+            timeouts[request.url.path] = request.extensions["timeout"]
+            return httpx.Response(200, json={})
+
+        async def run():
+            async with AsyncOCRAPIClient(base_url="http://api.test", timeout=300) as client:
+                transport = httpx.MockTransport(handler)
+                await client._client.aclose()
+                client._client = httpx.AsyncClient(transport=transport, timeout=client._client.timeout)
+                await client.health_check()
+                await client.process_document(sample_file)
+
+        asyncio.run(run())
+
+        health, upload = timeouts["/api/v1/health"], timeouts["/api/v1/ocr"]
+        assert health["connect"] == upload["connect"] == api_client_module.CONNECT_TIMEOUT
+        assert health["read"] == api_client_module.PROBE_TIMEOUT
+        assert upload["read"] == 300
+
+    @pytest.mark.unit
+    def test_connection_error(self):
+        """Test connection failures map to an unsuccessful response."""
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        async def run():
+            async with AsyncOCRAPIClient(base_url="http://api.test") as client:
+                await client._client.aclose()
+                client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                return await client.health_check()
+
+        result = asyncio.run(run())
+
+        assert result.success is False
+        assert "Connection failed" in result.error
+
+
+class TestStreamBatch:
+    """Tests for NDJSON batch streaming."""
+
+    @pytest.mark.unit
+    def test_yields_result_per_line(self, client, sample_file):
+        """Test each NDJSON line becomes its own response."""
+        response = MagicMock(status_code=200)
+        response.iter_lines.return_value = [
+            b'{"filename": "a.png", "status": "completed", "result": {}}',
+            b"",
+            b'{"filename": "b.xyz", "status": "error", "error": "Unsupported file type: .xyz"}',
+        ]
+
+        with patch.object(client._session, "post", return_value=response) as mock_post:
+            results = list(client.stream_batch([sample_file, sample_file]))
+
+        assert [r.success for r in results] == [True, False]
+        assert results[1].error == "Unsupported file type: .xyz"
+        assert mock_post.call_args.kwargs["stream"] is True
+        response.close.assert_called_once()
@@ -6,6 +6,7 @@ from core.document_classifier import (
     ClassificationResult,
     get_document_classifier
 )
+from tests.helpers import has_any
 
 
 class TestDocumentClassifier:
@@ -94,7 +95,7 @@ class TestDocumentClassifier:
         result = self.classifier.classify(text)
 
         assert result.document_type == DocumentType.CONTRACT
-        assert "agreement" in result.keywords_found or "contract" in result.keywords_found
+        assert has_any(result.keywords_found, "agreement", "contract")
 
     def test_classify_medical(self):
         """Test classification of medical document."""
@@ -190,6 +191,19 @@ class TestDocumentClassifier:
 
         assert classifier1 is classifier2
 
+    @pytest.mark.parametrize("pattern,expected", [
+        (r"invoice\s*#?\s*:?\s*\w+", "invoice"),
+        (r"expir(y|ation)\s+date", "expir"),
+        (r"sincerely\s*,", "sincerely"),
+        (r"ab?c", "a"),
+        (r"_+\s*\(.*?\)", ""),
+        (r"foo|bar", ""),
+        (r"(foo|bar)baz", ""),
+    ])
+    def test_leading_literal(self, pattern, expected):
+        """Test regex gates only use literals every match must start with."""
+        assert DocumentClassifier._leading_literal(pattern) == expected
+
 
 class TestDocumentType:
     """Test DocumentType enum."""
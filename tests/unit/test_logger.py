@@ -0,0 +1,130 @@
+"""
+Unit tests for structured logging.
+"""
+import json
+import logging
+from datetime import datetime, timezone
+
+import pytest
+
+import utils.logger as logger_module
+from utils.logger import (
+    JSONFileHandler,
+    JSONFormatter,
+    clear_request_context,
+    set_request_context,
+    setup_logger,
+)
+
+
+def _record(message="hello", created=None, **extra_data):
+    """Log record as StructuredLogger builds it."""
+    record = logging.LogRecord("nanonets.test", logging.INFO, __file__, 1, message, (), None)
+    if created is not None:
+        record.created = created
+    if extra_data:
+        record.extra_data = extra_data
+    return record
+
+
+class TestJSONFormatter:
+    """Tests for JSONFormatter."""
+
+    @pytest.mark.unit
+    def test_timestamp_from_record_time(self):
+        """Test the timestamp is the record's creation time in UTC."""
+        created = datetime(2024, 1, 15, 10, 30, 5, 123456, tzinfo=timezone.utc).timestamp()
+
+        output = json.loads(JSONFormatter().format(_record(created=created)))
+
+        assert output["timestamp"] == "2024-01-15T10:30:05.123456Z"
+
+    @pytest.mark.unit
+    def test_timestamp_cache_tracks_second(self):
+        """Test records in a new second get a new timestamp prefix."""
+        formatter = JSONFormatter()
+        base = datetime(2024, 1, 15, 10, 30, 5, tzinfo=timezone.utc).timestamp()
+
+        first = json.loads(formatter.format(_record(created=base + 0.5)))
+        second = json.loads(formatter.format(_record(created=base + 1.25)))
+
+        assert first["timestamp"] == "2024-01-15T10:30:05.500000Z"
+        assert second["timestamp"] == "2024-01-15T10:30:06.250000Z"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_fields_and_context(self, monkeypatch, has_orjson):
+        """Test message, extra data and request context land in the output."""
+        if has_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(logger_module, "HAS_ORJSON", has_orjson)
+        set_request_context(request_id="req_1")
+        try:
+            output = json.loads(JSONFormatter().format(_record(pages=3)))
+        finally:
+            clear_request_context()
+
+        assert output["message"] == "hello"
+        assert output["level"] == "INFO"
+        assert output["request_id"] == "req_1"
+        assert output["pages"] == 3
+
+
+class TestJSONFileHandler:
+    """Tests for the buffered JSON file handler."""
+
+    @pytest.mark.unit
+    def test_writes_json_lines(self, tmp_path):
+        """Test each record is on disk as one JSON line as soon as it is logged."""
+        path = tmp_path / "app.log"
+        handler = JSONFileHandler(str(path))
+        try:
+            handler.handle(_record("first"))
+            assert json.loads(path.read_text(encoding="utf-8"))["message"] == "first"
+
+            handler.handle(_record("second", pages=2))
+            lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        finally:
+            handler.close()
+
+        assert [line["message"] for line in lines] == ["first", "second"]
+        assert lines[1]["pages"] == 2
+
+    @pytest.mark.unit
+    def test_stock_formatter(self, tmp_path):
+        """Test a plain logging.Formatter set on the handler still writes lines."""
+        path = tmp_path / "app.log"
+        handler = JSONFileHandler(str(path))
+        handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        try:
+            handler.handle(_record("plain"))
+        finally:
+            handler.close()
+
+        assert path.read_text(encoding="utf-8") == "INFO plain\n"
+
+
+class TestSetupLogger:
+    """Tests for the legacy setup_logger wrapper."""
+
+    @pytest.mark.unit
+    def test_repeat_calls_keep_handlers(self):
+        """Test calling again does not rebuild the logger's handlers."""
+        first = setup_logger("nanonets.test.setup", "debug")
+        handlers = list(first.handlers)
+
+        second = setup_logger("nanonets.test.setup", "DEBUG")
+
+        assert second is first
+        assert second.handlers == handlers
+        assert second.level == logging.DEBUG
+
+    @pytest.mark.unit
+    def test_level_follows_latest_call(self):
+        """Test switching levels back and forth applies each call's level."""
+        name = "nanonets.test.levels"
+
+        assert setup_logger(name, "INFO").level == logging.INFO
+        assert setup_logger(name, "DEBUG").level == logging.DEBUG
+        assert setup_logger(name, "INFO").level == logging.INFO
+        assert setup_logger(name).level == logging.INFO
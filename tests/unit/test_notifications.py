@@ -0,0 +1,168 @@
+"""
+Unit tests for notification services.
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+
+from services.notifications.base import NotificationService, NotificationType
+from services.notifications.email import EmailNotifier
+from services.notifications.slack import SlackNotifier
+
+pytestmark = pytest.mark.notifications
+
+# Canned responses shared by every test instead of building mocks per call
+_RESP_200 = MagicMock(status_code=200)
+_RESP_202 = MagicMock(status_code=202)
+_RESP_500 = MagicMock(status_code=500, text="Internal Server Error")
+
+
+@pytest.fixture(scope="module")
+def _requests_patch():
+    """Patch requests.post once for this module; later modules see the real one."""
+    patcher = patch("requests.post")
+    mock = patcher.start()
+    yield mock
+    patcher.stop()
+
+
+@pytest.fixture
+def mock_post(_requests_patch):
+    """Module-wide requests.post mock, reset to a 200 response."""
+    _requests_patch.reset_mock()
+    _requests_patch.side_effect = None
+    _requests_patch.return_value = _RESP_200
+    return _requests_patch
+
+
+@pytest.fixture
+def slack(monkeypatch):
+    monkeypatch.setenv("SLACK_WEBHOOK_URL", "https://hooks.slack.com/services/T000/B000/XXX")
+    return SlackNotifier()
+
+
+@pytest.fixture
+def sendgrid_email(monkeypatch):
+    monkeypatch.setenv("SENDGRID_API_KEY", "sg-test-key")
+    return EmailNotifier()
+
+
+class TestSlackNotifier:
+    """Tests for SlackNotifier class."""
+
+    @pytest.mark.unit
+    def test_send(self, slack, mock_post):
+        """Test sending a notification to the webhook."""
+        sent = slack.send(
+            NotificationType.DOCUMENT_PROCESSED,
+            [],
+            {"document_id": "doc_123", "pages": 2}
+        )
+
+        assert sent is True
+        mock_post.assert_called_once()
+        assert mock_post.call_args.args[0] == slack.webhook_url
+
+    @pytest.mark.unit
+    def test_send_http_error(self, slack, mock_post):
+        """Test non-200 webhook response reports failure."""
+        mock_post.return_value = _RESP_500
+
+        assert slack.send(NotificationType.DOCUMENT_FAILED, [], {}) is False
+
+    @pytest.mark.unit
+    def test_send_recovers_after_failures(self, slack, mock_post):
+        """Test repeated sends succeed once the webhook recovers."""
+        calls = {"n": 0}
+
+        def _post(*args, **kwargs):
+            calls["n"] += 1
+            return _RESP_500 if calls["n"] < 3 else _RESP_200
+
+        mock_post.side_effect = _post
+
+        results = [slack.send(NotificationType.DOCUMENT_PROCESSED, [], {}) for _ in range(3)]
+
+        assert results == [False, False, True]
+        assert mock_post.call_count == 3
+
+    @pytest.mark.unit
+    def test_send_without_webhook(self, monkeypatch, mock_post):
+        """Test sending is skipped when no webhook is configured."""
+        monkeypatch.delenv("SLACK_WEBHOOK_URL", raising=False)
+        notifier = SlackNotifier()
+
+        assert notifier.send(NotificationType.DOCUMENT_PROCESSED, [], {}) is False
+        mock_post.assert_not_called()
+
+    @pytest.mark.unit
+    def test_build_message(self, slack):
+        """Test message payload uses the type color and data fields."""
+        message = slack._build_message(
+            NotificationType.DOCUMENT_FAILED,
+            {"document_id": "doc_123"}
+        )
+
+        attachment = message["attachments"][0]
+        assert attachment["color"] == "#ff0000"
+        assert attachment["fields"][0]["title"] == "Document Id"
+
+    @pytest.mark.unit
+    def test_send_direct_message(self, slack, mock_post):
+        """Test direct message payload includes channel and blocks."""
+        sent = slack.send_direct_message("#ops", "hello", blocks=[{"type": "divider"}])
+
+        assert sent is True
+        payload = mock_post.call_args.kwargs["json"]
+        assert payload["channel"] == "#ops"
+        assert payload["blocks"] == [{"type": "divider"}]
+
+
+class TestEmailNotifier:
+    """Tests for EmailNotifier class."""
+
+    @pytest.mark.unit
+    def test_email_content(self):
+        """Test subject and body rendering from templates."""
+        notifier = EmailNotifier()
+        subject, body = notifier._get_email_content(
+            NotificationType.DOCUMENT_FAILED,
+            {"document_id": "doc_123", "error": "timeout"}
+        )
+
+        assert subject == "Document Processing Failed"
+        assert "doc_123" in body
+        assert "timeout" in body
+
+    @pytest.mark.unit
+    def test_send_via_sendgrid(self, sendgrid_email, mock_post):
+        """Test SendGrid delivery when an API key is configured."""
+        mock_post.return_value = _RESP_202
+
+        sent = sendgrid_email.send(
+            NotificationType.EXPORT_COMPLETED,
+            ["user@example.com"],
+            {"export_id": "exp_1", "format": "csv", "records": 10}
+        )
+
+        assert sent is True
+        payload = mock_post.call_args.kwargs["json"]
+        assert payload["personalizations"][0]["to"] == [{"email": "user@example.com"}]
+
+
+class TestNotificationService:
+    """Tests for NotificationService dispatch."""
+
+    @pytest.mark.unit
+    def test_send_to_registered_channels(self, slack, mock_post):
+        """Test dispatch reports per-channel success."""
+        service = NotificationService()
+        service.register_channel("slack", slack)
+
+        results = service.send(
+            NotificationType.DOCUMENT_PROCESSED,
+            [],
+            {"document_id": "doc_123"},
+            channels=["slack", "sms"]
+        )
+
+        assert results == {"slack": True, "sms": False}
@@ -8,10 +8,15 @@ from core.output_parser import OutputParser
 class TestOutputParser:
     """Tests for OutputParser class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def parser(self):
         return OutputParser()
 
+    @pytest.fixture(scope="class")
+    def parsed_sample(self, parser, sample_ocr_text):
+        """Sample OCR text parsed once and shared across tests."""
+        return parser.parse(sample_ocr_text)
+
     @pytest.mark.unit
     def test_parse_empty_text(self, parser):
         """Test parsing empty text."""
@@ -19,10 +24,9 @@ class TestOutputParser:
         assert result.pages == []
 
     @pytest.mark.unit
-    def test_parse_single_page(self, parser, sample_ocr_text):
+    def test_parse_single_page(self, parsed_sample):
         """Test parsing a single page."""
-        result = parser.parse(sample_ocr_text)
-        assert len(result.pages) == 1
+        assert len(parsed_sample.pages) == 1
 
     @pytest.mark.unit
     def test_extract_tables(self, parser):
@@ -102,10 +106,9 @@ class TestOutputParser:
         assert len(unchecked) == 1
 
     @pytest.mark.unit
-    def test_to_dict(self, parser, sample_ocr_text):
+    def test_to_dict(self, parser, parsed_sample):
         """Test conversion to dictionary."""
-        result = parser.parse(sample_ocr_text)
-        data = parser.to_dict(result)
+        data = parser.to_dict(parsed_sample)
 
         assert "pages" in data
         assert isinstance(data["pages"], list)
@@ -0,0 +1,143 @@
+"""
+Unit tests for S3 storage service.
+"""
+import io
+from datetime import datetime
+from unittest.mock import create_autospec, patch
+
+import pytest
+
+boto3 = pytest.importorskip("boto3")
+
+
+@pytest.fixture(scope="module")
+def _s3_autospec():
+    """Autospecced S3 client, introspected once per module."""
+    return create_autospec(boto3.client("s3", region_name="us-east-1"), instance=True)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _fake_boto3_client(_s3_autospec):
+    """Stub boto3.client for this module so no credentials or endpoints are probed."""
+    patcher = patch("boto3.client", return_value=_s3_autospec)
+    patcher.start()
+    yield
+    patcher.stop()
+
+
+@pytest.fixture
+def s3_client(_s3_autospec):
+    """Shared S3 client spec with call history and canned returns cleared."""
+    _s3_autospec.reset_mock(return_value=True, side_effect=True)
+    return _s3_autospec
+
+
+@pytest.fixture
+def storage(s3_client):
+    """S3StorageService wired to the autospecced client."""
+    from services.s3_storage import S3StorageService
+
+    service = S3StorageService()
+    s3_client.reset_mock()
+    return service
+
+
+@pytest.fixture(params=[b"test file content", b"x" * 4096], ids=["small", "4k"])
+def upload_buffer(request):
+    """In-memory upload body, rewound after each use."""
+    buf = io.BytesIO(request.param)
+    yield buf
+    buf.seek(0)
+
+
+class TestS3StorageService:
+    """Tests for S3StorageService class."""
+
+    @pytest.mark.unit
+    def test_upload_file(self, storage, s3_client, upload_buffer):
+        """Test uploading a file-like object."""
+        result = storage.upload_file(upload_buffer, "doc.pdf")
+
+        s3_client.put_object.assert_called_once()
+        assert result["bucket"] == storage.bucket_name
+        assert result["size_bytes"] == len(upload_buffer.getvalue())
+        assert result["key"].endswith("_doc.pdf")
+
+    @pytest.mark.unit
+    def test_upload_bytes(self, storage, s3_client):
+        """Test uploading raw bytes with tenant isolation."""
+        result = storage.upload_file(b"raw bytes", "doc.pdf", tenant_id="acme")
+
+        assert result["key"].startswith("acme/")
+        kwargs = s3_client.put_object.call_args.kwargs
+        assert kwargs["Body"] == b"raw bytes"
+        assert kwargs["Metadata"]["original_filename"] == "doc.pdf"
+
+    @pytest.mark.unit
+    def test_download_file(self, storage, s3_client):
+        """Test downloading file content."""
+        s3_client.get_object.return_value = {"Body": io.BytesIO(b"content")}
+
+        assert storage.download_file("some/key") == b"content"
+        s3_client.get_object.assert_called_once_with(
+            Bucket=storage.bucket_name, Key="some/key"
+        )
+
+    @pytest.mark.unit
+    def test_get_presigned_url(self, storage, s3_client):
+        """Test presigned URL generation."""
+        s3_client.generate_presigned_url.return_value = "https://signed.example.com"
+
+        assert storage.get_presigned_url("some/key") == "https://signed.example.com"
+
+    @pytest.mark.unit
+    def test_delete_file(self, storage, s3_client):
+        """Test deleting a file."""
+        assert storage.delete_file("some/key") is True
+        s3_client.delete_object.assert_called_once()
+
+    @pytest.mark.unit
+    def test_delete_file_failure(self, storage, s3_client):
+        """Test delete returns False on client errors."""
+        s3_client.delete_object.side_effect = Exception("boom")
+
+        assert storage.delete_file("some/key") is False
+
+    @pytest.mark.unit
+    def test_list_files(self, storage, s3_client):
+        """Test listing files with a prefix."""
+        s3_client.list_objects_v2.return_value = {
+            "Contents": [
+                {"Key": "a/b.pdf", "Size": 10, "LastModified": datetime(2024, 1, 15)}
+            ]
+        }
+
+        files = storage.list_files(prefix="a/")
+
+        assert files[0]["key"] == "a/b.pdf"
+        assert files[0]["size"] == 10
+
+    @pytest.mark.unit
+    def test_get_file_metadata(self, storage, s3_client):
+        """Test reading object metadata."""
+        s3_client.head_object.return_value = {
+            "ContentLength": 42,
+            "ContentType": "application/pdf",
+            "LastModified": datetime(2024, 1, 15),
+            "Metadata": {"content_hash": "abc"},
+        }
+
+        metadata = storage.get_file_metadata("some/key")
+
+        assert metadata["size"] == 42
+        assert metadata["metadata"]["content_hash"] == "abc"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("method,args,expected_type", [
+        ("delete_file", ("some/key",), bool),
+        ("list_files", ("",), list),
+        ("health_check", (), bool),
+    ])
+    def test_return_types(self, storage, s3_client, method, args, expected_type):
+        """Test public methods return their documented types."""
+        assert isinstance(getattr(storage, method)(*args), expected_type)
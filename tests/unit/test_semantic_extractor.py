@@ -6,6 +6,7 @@ from core.semantic_extractor import (
     SemanticExtractionResult,
     get_semantic_extractor
 )
+from tests.helpers import has_any
 
 
 class TestSemanticExtractor:
@@ -30,7 +31,7 @@ class TestSemanticExtractor:
         assert len(result.entities) > 0
 
         entity_types = [e["type"] for e in result.entities]
-        assert "email" in entity_types or "phone" in entity_types or "money" in entity_types
+        assert has_any(entity_types, "email", "phone", "money")
 
     def test_extract_payment_info(self):
         """Test extraction of payment information."""
@@ -1,18 +1,21 @@
 """Tests for structured output processor."""
 import pytest
+import core.structured_output as structured_output
 from core.structured_output import (
     StructuredOutputProcessor,
     get_structured_processor,
     process_to_structured
 )
+from tests.helpers import has_any
 
 
 class TestStructuredOutputProcessor:
     """Test structured output processing."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.processor = StructuredOutputProcessor()
+    @classmethod
+    def setup_class(cls):
+        """Build one processor shared by the class's tests."""
+        cls.processor = StructuredOutputProcessor()
 
     def test_process_invoice(self):
         """Test processing invoice text."""
@@ -131,7 +134,7 @@ class TestStructuredOutputProcessor:
 
         entity_types = [e["type"] for e in entities]
         # Should extract at least some entities
-        assert any(t in entity_types for t in ["email", "phone", "money", "date"])
+        assert has_any(entity_types, "email", "phone", "money", "date")
 
     def test_language_detection(self):
         """Test language detection in output."""
@@ -170,6 +173,17 @@ class TestStructuredOutputProcessor:
         assert result["confidence"] == 0
         assert result["extracted_fields"] == {}
 
+    def test_blank_text_skips_detectors(self, monkeypatch):
+        """Test whitespace-only text bypasses classification but keeps tables."""
+        monkeypatch.setattr(self.processor.classifier, "classify", None)
+        tables_html = ["<table><tr><th>Item</th><th>Qty</th></tr><tr><td>Widget</td><td>1</td></tr></table>"]
+
+        result = self.processor.process("  \n", tables_html)
+
+        assert result["document_type"] == "unknown"
+        assert result["language"] == "unknown"
+        assert result["line_items"] == [{"description": "Widget", "quantity": "1"}]
+
     def test_nested_field_structure(self):
         """Test nested field structuring."""
         text = """
@@ -211,13 +225,38 @@ class TestStructuredOutputProcessor:
         assert "document_type" in result
         assert "extracted_fields" in result
 
+    def test_repeated_input_cached(self):
+        """Test identical input is served from cache as an independent copy."""
+        processor = StructuredOutputProcessor()
+        text = "Invoice # 123, Total: $500"
+        first = processor.process(text)
+        first["extracted_fields"]["total"] = "tampered"
+
+        second = processor.process(text)
+
+        assert second["extracted_fields"]["total"] == "500"
+        assert len(processor._result_cache) == 1
+
+    def test_cache_bounded_by_input_size(self, monkeypatch):
+        """Test cached results are evicted once their inputs exceed the budget."""
+        monkeypatch.setattr(structured_output, "RESULT_CACHE_CHARS", 60)
+        processor = StructuredOutputProcessor()
+
+        for total in range(5):
+            processor.process(f"Invoice # 123, Total: ${total}00")
+
+        assert len(processor._result_cache) == 2
+        assert processor._cache_chars <= 60
+        assert processor.process("Invoice # 123, Total: $400")["extracted_fields"]["total"] == "400"
+
 
 class TestLineItemParsing:
     """Test line item parsing specifically."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.processor = StructuredOutputProcessor()
+    @classmethod
+    def setup_class(cls):
+        """Build one processor shared by the class's tests."""
+        cls.processor = StructuredOutputProcessor()
 
     def test_parse_with_sku(self):
         """Test parsing items with SKU codes."""
@@ -240,3 +279,26 @@ class TestLineItemParsing:
 
         result = self.processor.process("Invoice", tables_html)
         assert result["line_items"] == []
+
+    def test_bs4_fallback_matches_lxml(self, monkeypatch):
+        """Test BeautifulSoup fallback yields the same items as lxml."""
+        table = """<table>
+        <tr><th>Item</th><th>Qty</th><th>Amount</th></tr>
+        <tr><td><b>Widget</b> A</td><td> 5 </td><td>$50.00</td></tr>
+        </table>"""
+
+        expected = self.processor._parse_line_items(table)
+        monkeypatch.setattr("core.structured_output.HAS_LXML", False)
+
+        assert self.processor._parse_line_items(table) == expected
+
+    def test_encoding_declaration_falls_back(self):
+        """Test markup lxml rejects as a str is parsed by BeautifulSoup instead."""
+        table = """<?xml version="1.0" encoding="UTF-8"?><table>
+        <tr><th>Item</th><th>Qty</th><th>Amount</th></tr>
+        <tr><td>Widget</td><td>5</td><td>$50.00</td></tr>
+        </table>"""
+
+        items = self.processor._parse_line_items(table)
+
+        assert items == [{"description": "Widget", "quantity": "5", "amount": "$50.00"}]
@@ -66,22 +66,18 @@ class TestValidators:
         assert error is None
 
     @pytest.mark.unit
-    def test_validate_url_empty(self):
-        """Test validation of empty URL (optional)."""
-        valid, error = validate_url("")
-        assert valid  # Empty is okay for optional field
-
-    @pytest.mark.unit
-    def test_validate_url_valid(self):
-        """Test validation of valid URL."""
-        valid, error = validate_url("https://example.com/api")
-        assert valid
-
-    @pytest.mark.unit
-    def test_validate_url_invalid(self):
-        """Test validation of invalid URL."""
-        valid, error = validate_url("not-a-url")
-        assert not valid
+    @pytest.mark.parametrize("url,expected", [
+        ("", True),  # Empty is okay for optional field
+        ("https://example.com/api", True),
+        ("http://localhost:8000/webhook", True),
+        ("http://127.0.0.1:8000", True),
+        ("not-a-url", False),
+        ("ftp://example.com/file", False),
+    ])
+    def test_validate_url(self, url, expected):
+        """Test URL validation across valid and invalid inputs."""
+        valid, error = validate_url(url)
+        assert valid is expected
 
     @pytest.mark.unit
     def test_validate_max_tokens_too_low(self):
@@ -128,6 +124,12 @@ class TestValidators:
         assert ".." not in result
         assert "/" not in result
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("filename", ["a.\\.pdf", "..\x00.", ".*.*."])
+    def test_sanitize_filename_no_rejoined_dots(self, filename):
+        """Test removing characters never leaves a new '..' behind."""
+        assert ".." not in sanitize_filename(filename)
+
     @pytest.mark.unit
     def test_sanitize_filename_preserves_name(self):
         """Test sanitization preserves valid filename."""
@@ -0,0 +1,106 @@
+"""
+Unit tests for the workflow engine.
+"""
+import asyncio
+
+import pytest
+
+from services.workflow import StepStatus, WorkflowEngine
+
+
+def _word_count(context, config):
+    """CPU-bound handler; module level so it pickles into worker processes."""
+    return {"words": len(context.get("text", "").split())}
+
+
+@pytest.fixture
+def engine():
+    """Workflow engine with a recording handler."""
+    engine = WorkflowEngine()
+    engine.register_handler("echo", lambda context, config: {"value": config.get("value")})
+    return engine
+
+
+class TestWorkflowLayers:
+    """Tests for grouping steps by dependency."""
+
+    @pytest.mark.unit
+    def test_steps_without_dependencies_run_in_order(self, engine):
+        """Test steps without depends_on each get their own layer."""
+        workflow = engine.create_workflow("seq", [
+            {"name": "a", "handler": "echo"},
+            {"name": "b", "handler": "echo"},
+        ])
+
+        layers = engine._build_layers(workflow)
+
+        assert [[step.name for step in layer] for layer in layers] == [["a"], ["b"]]
+
+    @pytest.mark.unit
+    def test_independent_steps_share_layer(self, engine):
+        """Test steps with satisfied dependencies are grouped together."""
+        workflow = engine.create_workflow("fan", [
+            {"name": "a", "handler": "echo", "depends_on": []},
+            {"name": "b", "handler": "echo", "depends_on": []},
+            {"name": "c", "handler": "echo", "depends_on": ["a", "b"]},
+        ])
+
+        layers = engine._build_layers(workflow)
+
+        assert [[step.name for step in layer] for layer in layers] == [["a", "b"], ["c"]]
+
+    @pytest.mark.unit
+    def test_unknown_dependency(self, engine):
+        """Test depending on a missing step is rejected."""
+        workflow = engine.create_workflow("bad", [
+            {"name": "a", "handler": "echo", "depends_on": ["missing"]},
+        ])
+
+        with pytest.raises(ValueError):
+            engine._build_layers(workflow)
+
+
+class TestExecuteAsync:
+    """Tests for concurrent workflow execution."""
+
+    @pytest.mark.unit
+    def test_outputs_merged_into_context(self, engine):
+        """Test every step's output lands in the execution context."""
+        workflow = engine.create_workflow("fan", [
+            {"name": "a", "handler": "echo", "config": {"value": 1}, "depends_on": []},
+            {"name": "b", "handler": "echo", "config": {"value": 2}, "depends_on": []},
+        ])
+
+        execution = asyncio.run(engine.execute_async(workflow.id, {}, max_concurrency=2))
+
+        assert execution.status == StepStatus.COMPLETED
+        assert execution.context["a_output"] == {"value": 1}
+        assert execution.context["b_output"] == {"value": 2}
+
+    @pytest.mark.unit
+    def test_failure_stops_later_layers(self, engine):
+        """Test a failing step halts the workflow after its layer."""
+        workflow = engine.create_workflow("fail", [
+            {"name": "a", "handler": "unknown_handler"},
+            {"name": "b", "handler": "echo"},
+        ])
+
+        execution = asyncio.run(engine.execute_async(workflow.id, {}))
+
+        assert execution.status == StepStatus.FAILED
+        assert "b" not in execution.step_results
+
+    @pytest.mark.unit
+    def test_cpu_bound_step_runs_in_process(self, engine):
+        """Test handlers registered as CPU-bound run through the process pool."""
+        engine.register_handler("word_count", _word_count, cpu_bound=True)
+        workflow = engine.create_workflow("cpu", [{"name": "count", "handler": "word_count"}])
+
+        try:
+            execution = asyncio.run(engine.execute_async(workflow.id, {"text": "one two three"}))
+        finally:
+            engine.shutdown()
+
+        assert execution.status == StepStatus.COMPLETED
+        assert execution.context["count_output"] == {"words": 3}
+        assert engine._process_pool is None
@@ -1,21 +1,186 @@
 """
 API Client for communicating with the FastAPI OCR backend.
 """
+import asyncio
+import contextlib
+import copy
+import hashlib
+import io
+import json
 import os
+import socket
+import sys
+import threading
+import httpx
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, BinaryIO, Iterator, List, Tuple, Union
+from dataclasses import dataclass, replace
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
+# Streams multipart uploads from disk; requests' files= builds the whole body in memory
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+    HAS_TOOLBELT = True
+except ImportError:
+    HAS_TOOLBELT = False
 
-@dataclass
+# h2 enables HTTP/2 in httpx: concurrent requests multiplex over one connection
+try:
+    import h2  # noqa: F401
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+# orjson decodes large OCR responses several times faster than json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Seconds to wait for the TCP connection; a down server should fail fast
+CONNECT_TIMEOUT = 5
+
+# Read timeout for small metadata endpoints
+PROBE_TIMEOUT = 10
+
+# Statuses meaning the server turned the request away unprocessed, so even an
+# upload is safe to resend: rate limited, or the model is still loading
+RETRY_STATUS_CODES = (429, 503)
+
+# First async retry delay in seconds; doubles on each further attempt
+RETRY_BACKOFF = 0.5
+
+# Successful upload responses kept per client, keyed on file content
+RESPONSE_CACHE_SIZE = 128
+
+# Read size when hashing documents for the response cache
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _keepalive_socket_options() -> List[tuple]:
+    """urllib3's defaults plus TCP keep-alive probes, where the platform supports them."""
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # Probe after 60s idle, then every 30s, so firewalls don't drop pooled sockets
+    # between UI interactions; TCP_KEEPIDLE/TCP_KEEPINTVL are Linux-specific
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 30))
+    return options
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections send TCP keep-alive probes."""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", _keepalive_socket_options())
+        super().init_poolmanager(*args, **kwargs)
+
+
+# Extensions the OCR endpoints accept; in-memory uploads must be named with one
+UPLOAD_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff', '.pdf'})
+
+# A document to upload: a path, an open binary file, or a (filename, content)
+# tuple whose content is bytes or an open binary file
+FileSource = Union[str, os.PathLike, BinaryIO, Tuple[str, Union[bytes, BinaryIO]]]
+
+
+def _upload_name(name: Any) -> str:
+    """Basename for an in-memory upload; the server picks the decoder by its extension."""
+    if not isinstance(name, str) or not name:
+        raise ValueError("In-memory uploads need a filename; pass (filename, content)")
+    filename = os.path.basename(name)
+    extension = os.path.splitext(filename)[1].lower()
+    if extension not in UPLOAD_EXTENSIONS:
+        raise ValueError(
+            f"Unsupported file type {extension or '(none)'!r} for {filename!r}; "
+            f"expected one of: {', '.join(sorted(UPLOAD_EXTENSIONS))}"
+        )
+    return filename
+
+
+@contextlib.contextmanager
+def _open_source(source: FileSource) -> Iterator[Tuple[str, BinaryIO]]:
+    """
+    Yield (filename, binary file) for an upload source.
+    
+    Paths are opened here and closed on exit; open files are rewound when
+    seekable and left open for the caller; bytes are wrapped in memory, so
+    callers holding an upload never need a temp file.
+    
+    Raises:
+        ValueError: If bytes come without a filename, or an in-memory
+            source's name lacks a supported extension
+    """
+    if isinstance(source, tuple):
+        name, content = source
+        filename = _upload_name(name)
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            yield filename, io.BytesIO(content)
+            return
+        source = content
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        raise ValueError("Raw bytes need a filename; pass (filename, content)")
+    elif isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            yield os.path.basename(source), f
+        return
+    else:
+        filename = _upload_name(getattr(source, "name", None))
+    
+    if source.seekable():
+        source.seek(0)
+    yield filename, source
+
+
+def _loads(content: bytes) -> Any:
+    """Decode a JSON response body."""
+    if HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class APIResponse:
-    """Standardized API response wrapper."""
+    """Standardized API response wrapper (immutable)."""
     success: bool
     data: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     status_code: int = 0
 
 
+def _to_api_response(response) -> APIResponse:
+    """Wrap a requests or httpx response in an APIResponse."""
+    if response.status_code == 200:
+        return APIResponse(
+            success=True,
+            data=_loads(response.content),
+            status_code=response.status_code
+        )
+    else:
+        # Proxies and crashed workers often answer with HTML or plain text
+        try:
+            body = _loads(response.content)
+        except ValueError:
+            body = None
+        error_detail = body.get("detail", response.text) if isinstance(body, dict) else response.text
+        return APIResponse(
+            success=False,
+            error=f"API Error ({response.status_code}): {error_detail}",
+            status_code=response.status_code
+        )
+
+
 class OCRAPIClient:
     """HTTP client for the Nanonets OCR API backend."""
     
@@ -37,6 +202,51 @@ class OCRAPIClient:
         self.api_key = api_key or os.getenv("API_KEY", "")
         self.timeout = timeout
         self.api_prefix = "/api/v1"
+        self._api_url = f"{self.base_url}{self.api_prefix}"
+        # Note: /status is at root level, not under api_prefix
+        self._status_url = f"{self.base_url}/status"
+        # Read timeouts per endpoint class; only uploads get the long budget
+        self.timeouts = {
+            "health": PROBE_TIMEOUT,
+            "models": PROBE_TIMEOUT,
+            "status": PROBE_TIMEOUT,
+            "ocr": timeout,
+            "ocr_batch": timeout * 2,
+        }
+        self._session = self._create_session()
+        self._response_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def _create_session(self) -> requests.Session:
+        """Create a pooled keep-alive session with retries for idempotent calls."""
+        # POST uploads are not retried: the server may already be processing them
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False
+        )
+        # pool_block makes surplus threads wait for a pooled socket instead of
+        # opening throwaway connections that each pay DNS and handshake again
+        adapter = _KeepAliveAdapter(
+            pool_connections=10, pool_maxsize=20, max_retries=retry, pool_block=True
+        )
+        session = requests.Session()
+        # Auth headers never change after init, so set them once on the session
+        session.headers.update(self._get_headers())
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
+    def close(self):
+        """Close pooled connections."""
+        self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
     
     def _get_headers(self) -> Dict[str, str]:
         """Get request headers with authentication."""
@@ -51,35 +261,31 @@ class OCRAPIClient:
         endpoint: str,
         files: Dict = None,
         data: Dict = None,
-        params: Dict = None
+        params: Dict = None,
+        timeout_key: str = "ocr"
     ) -> APIResponse:
         """Make HTTP request to the API."""
-        url = f"{self.base_url}{self.api_prefix}{endpoint}"
+        read_timeout = self.timeouts[timeout_key]
+        url = f"{self._api_url}{endpoint}"
+        headers = None
+        
+        if files and HAS_TOOLBELT:
+            encoder = self._encode_multipart(files, data)
+            headers = {"Content-Type": encoder.content_type}
+            files, data = None, encoder
         
         try:
-            response = requests.request(
+            response = self._session.request(
                 method=method,
                 url=url,
-                headers=self._get_headers(),
+                headers=headers,
                 files=files,
                 data=data,
                 params=params,
-                timeout=self.timeout
+                timeout=(CONNECT_TIMEOUT, read_timeout)
             )
             
-            if response.status_code == 200:
-                return APIResponse(
-                    success=True,
-                    data=response.json(),
-                    status_code=response.status_code
-                )
-            else:
-                error_detail = response.json().get("detail", response.text)
-                return APIResponse(
-                    success=False,
-                    error=f"API Error ({response.status_code}): {error_detail}",
-                    status_code=response.status_code
-                )
+            return _to_api_response(response)
                 
         except requests.exceptions.ConnectionError:
             return APIResponse(
@@ -89,7 +295,7 @@ class OCRAPIClient:
         except requests.exceptions.Timeout:
             return APIResponse(
                 success=False,
-                error=f"Request timed out after {self.timeout} seconds"
+                error=f"Request timed out after {read_timeout} seconds"
             )
         except Exception as e:
             return APIResponse(
@@ -97,22 +303,61 @@ class OCRAPIClient:
                 error=f"Request failed: {str(e)}"
             )
     
+    def _encode_multipart(self, files, data: Dict = None) -> "MultipartEncoder":
+        """Build a streaming multipart body with form fields before files, as requests does."""
+        fields = [(key, str(value)) for key, value in (data or {}).items()]
+        fields.extend(files.items() if isinstance(files, dict) else files)
+        return MultipartEncoder(fields=fields)
+    
+    def _upload(self, endpoint: str, file_path: FileSource, data: Dict = None) -> APIResponse:
+        """
+        Upload a single document to an endpoint.
+        
+        Successful responses are cached on the file's SHA-256, the endpoint and
+        the form data, so re-analyzing an unchanged file skips the round trip.
+        Requests with a webhook, and non-seekable streams, are never cached.
+        """
+        cache_key = None
+        
+        with _open_source(file_path) as (filename, f):
+            if f.seekable() and not (data and data.get("webhook_url")):
+                digest = hashlib.sha256()
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+                cache_key = (digest.hexdigest(), endpoint, tuple(sorted((data or {}).items())))
+                with self._cache_lock:
+                    cached = self._response_cache.get(cache_key)
+                    if cached is not None:
+                        self._response_cache.move_to_end(cache_key)
+                        return replace(cached, data=copy.deepcopy(cached.data))
+                f.seek(0)
+            
+            files = {"file": (filename, f)}
+            result = self._make_request("POST", endpoint, files=files, data=data)
+        
+        if cache_key is not None and result.success:
+            with self._cache_lock:
+                self._response_cache[cache_key] = replace(result, data=copy.deepcopy(result.data))
+                if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
+        return result
+    
     def health_check(self) -> APIResponse:
         """Check if the API server is healthy."""
-        return self._make_request("GET", "/health")
+        return self._make_request("GET", "/health", timeout_key="health")
     
     def get_model_info(self) -> APIResponse:
         """Get information about the loaded model."""
-        return self._make_request("GET", "/models")
+        return self._make_request("GET", "/models", timeout_key="models")
     
     def get_status(self) -> APIResponse:
         """Get detailed server status including model loading state."""
-        # Note: /status is at root level, not under api_prefix
-        url = f"{self.base_url}/status"
         try:
-            response = requests.get(url, headers=self._get_headers(), timeout=self.timeout)
+            response = self._session.get(
+                self._status_url, timeout=(CONNECT_TIMEOUT, self.timeouts["status"])
+            )
             if response.status_code == 200:
-                return APIResponse(success=True, data=response.json(), status_code=200)
+                return APIResponse(success=True, data=_loads(response.content), status_code=200)
             else:
                 return APIResponse(success=False, error=response.text, status_code=response.status_code)
         except Exception as e:
@@ -121,7 +366,7 @@ class OCRAPIClient:
     
     def process_document(
         self,
-        file_path: str,
+        file_path: FileSource,
         max_tokens: int = 2048,
         max_image_size: int = 1536,
         output_format: str = "json",
@@ -136,7 +381,7 @@ class OCRAPIClient:
         Process a document with OCR (API v1).
         
         Args:
-            file_path: Path to the document file
+            file_path: Path, open binary file or (filename, content) tuple
             max_tokens: Maximum tokens for generation
             max_image_size: Maximum image dimension
             output_format: Output format (json, xml, csv)
@@ -150,26 +395,24 @@ class OCRAPIClient:
         Returns:
             APIResponse with OCR results
         """
-        with open(file_path, "rb") as f:
-            files = {"file": (os.path.basename(file_path), f)}
-            data = {
-                "max_tokens": max_tokens,
-                "max_image_size": max_image_size,
-                "output_format": output_format,
-                "extract_fields": extract_fields,
-                "structured_output": structured_output,
-                "detect_language": detect_language,
-                "classify_document": classify_document,
-                "confidence_threshold": confidence_threshold
-            }
-            if webhook_url:
-                data["webhook_url"] = webhook_url
-                
-            return self._make_request("POST", "/ocr", files=files, data=data)
+        data = {
+            "max_tokens": max_tokens,
+            "max_image_size": max_image_size,
+            "output_format": output_format,
+            "extract_fields": extract_fields,
+            "structured_output": structured_output,
+            "detect_language": detect_language,
+            "classify_document": classify_document,
+            "confidence_threshold": confidence_threshold
+        }
+        if webhook_url:
+            data["webhook_url"] = webhook_url
+            
+        return self._upload("/ocr", file_path, data)
     
     def process_document_v2(
         self,
-        file_path: str,
+        file_path: FileSource,
         max_tokens: int = 2048,
         webhook_url: str = None
     ) -> APIResponse:
@@ -177,135 +420,417 @@ class OCRAPIClient:
         Process a document with OCR (API v2 - enhanced structured output).
         
         Args:
-            file_path: Path to the document file
+            file_path: Path, open binary file or (filename, content) tuple
             max_tokens: Maximum tokens for generation
             webhook_url: Optional webhook URL for callback
             
         Returns:
             APIResponse with structured OCR results
         """
-        with open(file_path, "rb") as f:
-            files = {"file": (os.path.basename(file_path), f)}
-            data = {"max_tokens": max_tokens}
-            if webhook_url:
-                data["webhook_url"] = webhook_url
-                
-            return self._make_request("POST", "/v2/ocr", files=files, data=data)
+        data = {"max_tokens": max_tokens}
+        if webhook_url:
+            data["webhook_url"] = webhook_url
+            
+        return self._upload("/v2/ocr", file_path, data)
     
-    def classify_document(self, file_path: str) -> APIResponse:
+    def classify_document(self, file_path: FileSource) -> APIResponse:
         """
         Classify document type.
         
         Args:
-            file_path: Path to the document file
+            file_path: Path, open binary file or (filename, content) tuple
             
         Returns:
             APIResponse with classification results
         """
-        with open(file_path, "rb") as f:
-            files = {"file": (os.path.basename(file_path), f)}
-            return self._make_request("POST", "/classify", files=files)
+        return self._upload("/classify", file_path)
     
-    def detect_language(self, file_path: str) -> APIResponse:
+    def detect_language(self, file_path: FileSource) -> APIResponse:
         """
         Detect document language.
         
         Args:
-            file_path: Path to the document file
+            file_path: Path, open binary file or (filename, content) tuple
             
         Returns:
             APIResponse with language detection results
         """
-        with open(file_path, "rb") as f:
-            files = {"file": (os.path.basename(file_path), f)}
-            return self._make_request("POST", "/detect-language", files=files)
+        return self._upload("/detect-language", file_path)
     
-    def extract_entities(self, file_path: str) -> APIResponse:
+    def extract_entities(self, file_path: FileSource) -> APIResponse:
         """
         Extract entities from document.
         
         Args:
-            file_path: Path to the document file
+            file_path: Path, open binary file or (filename, content) tuple
             
         Returns:
             APIResponse with extracted entities
         """
-        with open(file_path, "rb") as f:
-            files = {"file": (os.path.basename(file_path), f)}
-            return self._make_request("POST", "/extract-entities", files=files)
+        return self._upload("/extract-entities", file_path)
+    
+    def analyze(self, file_path: FileSource) -> Dict[str, APIResponse]:
+        """
+        Classify, detect language and extract entities in parallel.
+        
+        The file is read once and the three uploads run concurrently over the
+        pooled session, so the wall time is that of the slowest call.
+        
+        Args:
+            file_path: Path, open binary file or (filename, content) tuple
+            
+        Returns:
+            Dict with "classification", "language" and "entities" APIResponses
+        """
+        with _open_source(file_path) as (filename, f):
+            content = f.read()
+        endpoints = {
+            "classification": "/classify",
+            "language": "/detect-language",
+            "entities": "/extract-entities",
+        }
+        
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+            futures = {
+                key: executor.submit(
+                    self._make_request, "POST", endpoint, files={"file": (filename, content)}
+                )
+                for key, endpoint in endpoints.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
     
     def get_structured_output(
         self,
-        file_path: str,
+        file_path: FileSource,
         max_tokens: int = 2048
     ) -> APIResponse:
         """
         Get fully structured output from document.
         
         Args:
-            file_path: Path to the document file
+            file_path: Path, open binary file or (filename, content) tuple
             max_tokens: Maximum tokens for generation
             
         Returns:
             APIResponse with structured output
         """
-        with open(file_path, "rb") as f:
-            files = {"file": (os.path.basename(file_path), f)}
-            data = {"max_tokens": max_tokens}
-            return self._make_request("POST", "/structured", files=files, data=data)
+        return self._upload("/structured", file_path, {"max_tokens": max_tokens})
     
     def process_batch(
         self,
-        file_paths: List[str],
+        file_paths: List[FileSource],
         max_tokens: int = 2048
     ) -> APIResponse:
         """
         Process multiple documents in batch.
         
         Args:
-            file_paths: List of paths to document files
+            file_paths: Paths, open binary files or (filename, content) tuples
             max_tokens: Maximum tokens for generation per document
             
         Returns:
             APIResponse with batch processing results
         """
-        files = []
-        file_handles = []
+        with contextlib.ExitStack() as stack:
+            files = self._open_batch(stack, file_paths)
+            data = {"max_tokens": max_tokens}
+            return self._make_request(
+                "POST", "/ocr/batch", files=files, data=data, timeout_key="ocr_batch"
+            )
+    
+    def _open_batch(self, stack: contextlib.ExitStack, file_paths: List[FileSource]) -> List:
+        """
+        Open batch files as multipart "files" parts, closed when the stack exits.
+        
+        The streaming encoder reads each handle only after the previous one is
+        exhausted, so the body is never held in memory as a whole.
+        """
+        return [("files", stack.enter_context(_open_source(path))) for path in file_paths]
+    
+    def stream_batch(
+        self,
+        file_paths: List[FileSource],
+        max_tokens: int = 2048
+    ) -> Iterator[APIResponse]:
+        """
+        Process multiple documents in batch, yielding each result as it finishes.
+        
+        The server streams one NDJSON line per document, so the first result
+        arrives after one document instead of after the whole batch.
+        
+        Args:
+            file_paths: Paths, open binary files or (filename, content) tuples
+            max_tokens: Maximum tokens for generation per document
+            
+        Yields:
+            One APIResponse per document, in input order; a single failed
+            APIResponse if the request itself fails
+        """
+        url = f"{self._api_url}/ocr/batch"
+        
+        with contextlib.ExitStack() as stack:
+            try:
+                files = self._open_batch(stack, file_paths)
+                data = {"max_tokens": max_tokens, "stream": True}
+                headers = None
+                if HAS_TOOLBELT:
+                    encoder = self._encode_multipart(files, data)
+                    headers = {"Content-Type": encoder.content_type}
+                    files, data = None, encoder
+                
+                response = self._session.post(
+                    url,
+                    files=files,
+                    data=data,
+                    headers=headers,
+                    stream=True,
+                    # Read timeout applies between lines, i.e. per document
+                    timeout=(CONNECT_TIMEOUT, self.timeouts["ocr"])
+                )
+                try:
+                    if response.status_code != 200:
+                        yield _to_api_response(response)
+                        return
+                    
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        item = _loads(line)
+                        yield APIResponse(
+                            success=item.get("status") == "completed",
+                            data=item,
+                            error=item.get("error"),
+                            status_code=response.status_code
+                        )
+                finally:
+                    # Return the connection to the pool even if the caller stops early
+                    response.close()
+            
+            except requests.exceptions.ConnectionError:
+                yield APIResponse(
+                    success=False,
+                    error=f"Connection failed. Is the API server running at {self.base_url}?"
+                )
+            except requests.exceptions.Timeout:
+                yield APIResponse(
+                    success=False,
+                    error=f"Request timed out after {self.timeouts['ocr']} seconds"
+                )
+
+
+class AsyncOCRAPIClient:
+    """
+    Asyncio HTTP client for the Nanonets OCR API backend.
+    
+    Lets a caller overlap several documents, or several analyses of one
+    document, instead of waiting on each request in turn.
+    """
+    
+    def __init__(
+        self,
+        base_url: str = None,
+        api_key: str = None,
+        timeout: int = 300,
+        max_connections: int = 20,
+        http2: bool = True,
+        max_retries: int = 2
+    ):
+        """
+        Initialize the async API client.
+        
+        Args:
+            base_url: Base URL of the API server (default: http://localhost:8000)
+            api_key: Optional API key for authentication
+            timeout: Request timeout in seconds (default: 300 for large documents)
+            max_connections: Maximum pooled connections
+            http2: Negotiate HTTP/2 when the h2 package is installed
+            max_retries: Resends after a 429 or 503, with exponential backoff
+        """
+        self.base_url = base_url or os.getenv("API_BASE_URL", "http://localhost:8000")
+        self.api_key = api_key or os.getenv("API_KEY", "")
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.api_prefix = "/api/v1"
+        self._api_url = f"{self.base_url}{self.api_prefix}"
+        
+        headers = {"Accept": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        self._client = httpx.AsyncClient(
+            headers=headers,
+            timeout=httpx.Timeout(timeout, connect=CONNECT_TIMEOUT),
+            limits=httpx.Limits(max_connections=max_connections, keepalive_expiry=60),
+            http2=http2 and HAS_H2
+        )
+    
+    async def close(self):
+        """Close pooled connections."""
+        await self._client.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        files: Dict = None,
+        data: Dict = None,
+        timeout: Optional[float] = None
+    ) -> APIResponse:
+        """Make HTTP request to the API; timeout overrides the client's read timeout."""
+        url = f"{self._api_url}{endpoint}"
+        read_timeout = timeout or self.timeout
+        request_timeout = (
+            httpx.Timeout(timeout, connect=CONNECT_TIMEOUT) if timeout else httpx.USE_CLIENT_DEFAULT
+        )
+        handles = [f for _, f in (files or {}).values()]
+        can_resend = all(f.seekable() for f in handles)
         
         try:
-            for path in file_paths:
-                f = open(path, "rb")
-                file_handles.append(f)
-                files.append(("files", (os.path.basename(path), f)))
+            for attempt in range(self.max_retries + 1):
+                response = await self._client.request(
+                    method, url, files=files, data=data, timeout=request_timeout
+                )
+                if (
+                    response.status_code not in RETRY_STATUS_CODES
+                    or attempt == self.max_retries
+                    or not can_resend
+                ):
+                    break
+                await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+                for f in handles:
+                    f.seek(0)
+            return _to_api_response(response)
+        
+        except httpx.ConnectError:
+            return APIResponse(
+                success=False,
+                error=f"Connection failed. Is the API server running at {self.base_url}?"
+            )
+        except httpx.TimeoutException:
+            return APIResponse(
+                success=False,
+                error=f"Request timed out after {read_timeout} seconds"
+            )
+        except Exception as e:
+            return APIResponse(
+                success=False,
+                error=f"Request failed: {str(e)}"
+            )
+    
+    async def _upload(self, endpoint: str, file_path: FileSource, data: Dict = None) -> APIResponse:
+        """Upload a single document to an endpoint."""
+        with _open_source(file_path) as (filename, f):
+            files = {"file": (filename, f)}
+            return await self._make_request("POST", endpoint, files=files, data=data)
+    
+    async def health_check(self) -> APIResponse:
+        """Check if the API server is healthy."""
+        return await self._make_request("GET", "/health", timeout=PROBE_TIMEOUT)
+    
+    async def process_document(self, file_path: FileSource, max_tokens: int = 2048) -> APIResponse:
+        """Process a document with OCR (API v1)."""
+        return await self._upload("/ocr", file_path, {"max_tokens": max_tokens})
+    
+    async def process_document_v2(
+        self,
+        file_path: FileSource,
+        max_tokens: int = 2048,
+        webhook_url: str = None
+    ) -> APIResponse:
+        """Process a document with OCR (API v2 - enhanced structured output)."""
+        data = {"max_tokens": max_tokens}
+        if webhook_url:
+            data["webhook_url"] = webhook_url
+        return await self._upload("/v2/ocr", file_path, data)
+    
+    async def classify_document(self, file_path: FileSource) -> APIResponse:
+        """Classify document type."""
+        return await self._upload("/classify", file_path)
+    
+    async def detect_language(self, file_path: FileSource) -> APIResponse:
+        """Detect document language."""
+        return await self._upload("/detect-language", file_path)
+    
+    async def extract_entities(self, file_path: FileSource) -> APIResponse:
+        """Extract entities from document."""
+        return await self._upload("/extract-entities", file_path)
+    
+    async def get_structured_output(self, file_path: FileSource, max_tokens: int = 2048) -> APIResponse:
+        """Get fully structured output from document."""
+        return await self._upload("/structured", file_path, {"max_tokens": max_tokens})
+    
+    async def process_batch(
+        self,
+        file_paths: List[FileSource],
+        max_tokens: int = 2048,
+        max_concurrency: int = 4
+    ) -> List[APIResponse]:
+        """
+        Process documents concurrently, one /ocr request each.
+        
+        Args:
+            file_paths: Paths, open binary files or (filename, content) tuples
+            max_tokens: Maximum tokens for generation per document
+            max_concurrency: Maximum uploads in flight at once
             
-            data = {"max_tokens": max_tokens}
-            return self._make_request("POST", "/ocr/batch", files=files, data=data)
-        finally:
-            for f in file_handles:
-                f.close()
+        Returns:
+            One APIResponse per file, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def process(path: FileSource) -> APIResponse:
+            async with semaphore:
+                return await self.process_document(path, max_tokens=max_tokens)
+        
+        return await asyncio.gather(*(process(path) for path in file_paths))
 
 
-# Global client instance
-_api_client: Optional[OCRAPIClient] = None
+# Shared clients per (base_url, api_key), least recently used first
+MAX_SHARED_CLIENTS = 8
+_api_clients: OrderedDict = OrderedDict()
+_api_client_lock = threading.Lock()
 
 
 def get_api_client(base_url: str = None, api_key: str = None) -> OCRAPIClient:
     """
-    Get or create the global API client instance.
+    Get or create the shared API client for a target.
+    
+    Clients are cached per base URL and API key, so UI events that switch
+    between endpoints keep each endpoint's pooled connections warm. Safe to
+    call from concurrent UI threads.
     
     Args:
-        base_url: Base URL of the API server
+        base_url: Base URL of the API server; None reuses the most recent client
         api_key: Optional API key
         
     Returns:
         OCRAPIClient instance
     """
-    global _api_client
-    
-    if _api_client is None or base_url is not None:
-        _api_client = OCRAPIClient(base_url=base_url, api_key=api_key)
-    
-    return _api_client
+    with _api_client_lock:
+        if base_url is None and _api_clients:
+            return next(reversed(_api_clients.values()))
+        
+        key = (
+            base_url or os.getenv("API_BASE_URL", "http://localhost:8000"),
+            api_key or os.getenv("API_KEY", "")
+        )
+        client = _api_clients.get(key)
+        if client is not None:
+            _api_clients.move_to_end(key)
+            return client
+        
+        client = OCRAPIClient(base_url=key[0], api_key=key[1])
+        _api_clients[key] = client
+        if len(_api_clients) > MAX_SHARED_CLIENTS:
+            # Return the evicted client's pooled sockets to the OS
+            _, evicted = _api_clients.popitem(last=False)
+            evicted.close()
+        return client
 
 
 if __name__ == "__main__":
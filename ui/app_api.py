@@ -10,21 +10,42 @@ warnings.filterwarnings("ignore", message=".*MessageFactory.*")
 warnings.filterwarnings("ignore", message=".*bcrypt.*")
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
+import asyncio
+import contextlib
 import gradio as gr
+import hashlib
+import html
 import json
 import os
 import re
+import time
+import uuid
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 
-from ui.api_client import get_api_client, OCRAPIClient
+from ui.api_client import get_api_client, AsyncOCRAPIClient, MAX_SHARED_CLIENTS
+from utils.logger import app_logger
 
+# orjson pretty-prints large OCR results in C instead of the pure-Python encoder
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _dumps_pretty(obj) -> str:
+    """Serialize an API payload as indented JSON for display."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
 
-def create_bounding_box_visualization(image: Image.Image, ocr_text: str) -> Image.Image:
-    """Create visualization with bounding boxes for detected elements."""
-    img_with_boxes = image.copy()
-    draw = ImageDraw.Draw(img_with_boxes)
 
+@lru_cache(maxsize=1)
+def _label_font():
+    """Font for visualization labels, located and loaded once per process."""
     try:
         # Try common font paths
         font_paths = [
@@ -32,15 +53,20 @@ def create_bounding_box_visualization(image: Image.Image, ocr_text: str) -> Imag
             "C:/Windows/Fonts/arial.ttf",
             "/System/Library/Fonts/Helvetica.ttc"
         ]
-        font = None
         for path in font_paths:
             if os.path.exists(path):
-                font = ImageFont.truetype(path, 14)
-                break
-        if font is None:
-            font = ImageFont.load_default()
-    except:
-        font = ImageFont.load_default()
+                return ImageFont.truetype(path, 14)
+    except (OSError, ImportError):
+        # Unreadable font file, or Pillow built without FreeType
+        pass
+    return ImageFont.load_default()
+
+
+def create_bounding_box_visualization(image: Image.Image, ocr_text: str) -> Image.Image:
+    """Create visualization with bounding boxes for detected elements."""
+    img_with_boxes = image.copy()
+    draw = ImageDraw.Draw(img_with_boxes)
+    font = _label_font()
 
     colors = {
         'table': (255, 0, 0),      # Red
@@ -54,11 +80,10 @@ def create_bounding_box_visualization(image: Image.Image, ocr_text: str) -> Imag
     y_offset = 10
 
     # Draw indicators for detected elements
-    from bs4 import BeautifulSoup
 
-    # Check for tables
-    soup = BeautifulSoup(ocr_text, 'html.parser')
-    if soup.find_all('table') or '<table' in ocr_text.lower():
+    # Check for tables; every <table> tag an HTML parser could find contains
+    # this substring, so the text is not parsed
+    if '<table' in ocr_text.lower():
         draw.rectangle([(10, y_offset), (width - 10, y_offset + 40)],
                        outline=colors['table'], width=3)
         draw.text((15, y_offset + 5), "📊 Table Detected", fill=colors['table'], font=font)
@@ -112,96 +137,163 @@ PREDEFINED_FIELDS = [
 ]
 
 
+_ASSET_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "asset"
+)
+
+_SAMPLE_FILES = [
+    ("invoice1.pdf", "Invoice PDF"),
+    ("docparsing_example1.jpg", "Document 1"),
+    ("docparsing_example2.jpg", "Document 2"),
+    ("ocr_example1.jpg", "OCR Example 1"),
+    ("ocr_example2.jpg", "OCR Example 2"),
+    ("docparsing_example3.jpg", "Document 3"),
+]
+
+
+def _find_sample_documents() -> tuple:
+    """Resolve the sample documents present in tests/asset with one directory scan."""
+    try:
+        with os.scandir(_ASSET_DIR) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return ()
+    return tuple(
+        os.path.join(_ASSET_DIR, filename)
+        for filename, _ in _SAMPLE_FILES
+        if filename in present
+    )
+
+
+# Resolved once at import; the assets ship with the repo and do not change at runtime
+_SAMPLES = _find_sample_documents()
+
+
 def get_sample_documents():
     """Get sample document paths from tests/asset directory."""
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    asset_dir = os.path.join(base_dir, "tests", "asset")
-
-    samples = []
-
-    if os.path.exists(asset_dir):
-        sample_files = [
-            ("invoice1.pdf", "Invoice PDF"),
-            ("docparsing_example1.jpg", "Document 1"),
-            ("docparsing_example2.jpg", "Document 2"),
-            ("ocr_example1.jpg", "OCR Example 1"),
-            ("ocr_example2.jpg", "OCR Example 2"),
-            ("docparsing_example3.jpg", "Document 3"),
-        ]
+    return list(_SAMPLES)
 
-        for filename, name in sample_files:
-            filepath = os.path.join(asset_dir, filename)
-            if os.path.exists(filepath):
-                samples.append(filepath)
 
-    return samples
+# Seconds a successful pre-flight health check is trusted per API endpoint
+HEALTH_CACHE_TTL = 600
 
+# base_url -> (monotonic time of check, successful health response)
+_HEALTH_CACHE = {}
 
-def process_document_via_api(
-    file,
-    max_new_tokens, max_image_size,
-    enabled_fields,
-    custom_field_1, custom_field_2, custom_field_3,
-    custom_field_4, custom_field_5, custom_field_6,
-    custom_field_7, custom_field_8, custom_field_9,
-    custom_field_10,
-    api_endpoint, api_key, api_method, webhook_url,
-    confidence_threshold, output_format, enable_batch
-):
-    """Orchestrate OCR via API and format for Gradio output."""
 
-    if file is None:
-        return ("Error: No file provided.", "0:00:00", "", "", "", "", "",
-                "", "", "", "", None, "", "", "", "")
+async def _cached_health(client: AsyncOCRAPIClient, ttl: float = HEALTH_CACHE_TTL):
+    """
+    Health check that reuses a recent success for the same endpoint.
+
+    Failures are never cached, and a server that goes down inside the
+    window surfaces through the processing request itself.
+    """
+    cached = _HEALTH_CACHE.get(client.base_url)
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1]
 
+    health = await client.health_check()
+    if health.success:
+        _HEALTH_CACHE[client.base_url] = (time.monotonic(), health)
+    else:
+        _HEALTH_CACHE.pop(client.base_url, None)
+    return health
+
+
+# OCR uploads in flight at once from the async handler; more would only queue
+# on the single model behind the API
+MAX_CONCURRENT_UPLOADS = 4
+
+# (base_url, api_key) -> AsyncOCRAPIClient, all bound to Gradio's event loop;
+# least recently used first, capped at MAX_SHARED_CLIENTS like the sync clients
+_ASYNC_CLIENTS: OrderedDict = OrderedDict()
+
+# AsyncOCRAPIClient -> requests in flight through it; an evicted client is
+# closed by whichever request finishes with it last
+_ASYNC_LEASES = {}
+
+# Created on first use so it binds to the running event loop
+_upload_semaphore = None
+
+
+async def _get_async_client(base_url: str, api_key: str) -> AsyncOCRAPIClient:
+    """Shared async client for an endpoint, keeping its connections pooled."""
+    key = (base_url, api_key or "")
+    client = _ASYNC_CLIENTS.get(key)
+    if client is not None:
+        _ASYNC_CLIENTS.move_to_end(key)
+        return client
+
+    client = AsyncOCRAPIClient(base_url=base_url, api_key=api_key)
+    _ASYNC_CLIENTS[key] = client
+    if len(_ASYNC_CLIENTS) > MAX_SHARED_CLIENTS:
+        # Every URL typed into the UI would otherwise keep its pool open;
+        # one still serving another session is left for its last request
+        _, evicted = _ASYNC_CLIENTS.popitem(last=False)
+        if evicted not in _ASYNC_LEASES:
+            await evicted.close()
+    return client
+
+
+@contextlib.asynccontextmanager
+async def _leased_async_client(base_url: str, api_key: str):
+    """Shared async client held open until this request is done with it."""
+    client = await _get_async_client(base_url, api_key)
+    _ASYNC_LEASES[client] = _ASYNC_LEASES.get(client, 0) + 1
     try:
-        # Use the configured API endpoint
-        client = get_api_client(base_url=api_endpoint, api_key=api_key)
-        
-        # Check API connection first
-        health = client.health_check()
-        if not health.success:
-            error_msg = f"API Connection Failed: {health.error}"
-            return (error_msg, "0:00:00", "", "", "", "", "",
-                    "", "", "", "", None, "", "", "", "")
-
-        # Process document via API v2 (structured output)
-        result = client.process_document_v2(
-            file_path=file.name,
-            max_tokens=max_new_tokens,
-            webhook_url=webhook_url if webhook_url else None
-        )
+        yield client
+    finally:
+        remaining = _ASYNC_LEASES.pop(client) - 1
+        if remaining:
+            _ASYNC_LEASES[client] = remaining
+        elif client not in _ASYNC_CLIENTS.values():
+            await client.close()
 
-        if not result.success:
-            error_msg = f"Processing Failed: {result.error}"
-            return (error_msg, "0:00:00", "", "", "", "", "",
-                    "", "", "", "", None, "", "", "", "")
-
-        data = result.data
-        
-        # Extract data from API response
-        processing_time_ms = data.get("processing_time_ms", 0)
-        processing_time = f"{processing_time_ms / 1000:.2f}s"
-        doc_info = data.get("document", {})
-        structured_result = data.get("result", {})
-
-        # OCR text - check multiple possible locations
-        raw_data = structured_result.get("raw", {})
-        ocr_text = raw_data.get("text", "") or structured_result.get("raw_text", "") or ""
-        
-        # If still empty, try to get from tables or other sources
-        if not ocr_text and raw_data.get("pages"):
-            # Combine text from all pages
-            page_texts = []
-            for page in raw_data.get("pages", []):
-                if page.get("text"):
-                    page_texts.append(page.get("text", ""))
-            ocr_text = "\n\n".join(page_texts)
-
-
-        # HTML preview
-        ocr_html = ocr_text.replace('\n', '<br>')
-        full_html = f"""
+
+def _get_upload_semaphore() -> asyncio.Semaphore:
+    """Semaphore bounding concurrent OCR uploads across Gradio sessions."""
+    global _upload_semaphore
+    if _upload_semaphore is None:
+        _upload_semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+    return _upload_semaphore
+
+
+def _error_outputs(message: str) -> tuple:
+    """Gradio outputs for a failed run: the message in the text pane, the rest empty."""
+    return (message, "0:00:00", "", "", "", "", "",
+            "", "", "", "", None, "", "", "", "")
+
+
+def _format_outputs(
+    file, data,
+    api_endpoint, api_key, api_method, webhook_url,
+    confidence_threshold, output_format
+) -> tuple:
+    """Format a v2 OCR API response into the Gradio output panes."""
+
+    # Extract data from API response
+    processing_time_ms = data.get("processing_time_ms", 0)
+    processing_time = f"{processing_time_ms / 1000:.2f}s"
+    doc_info = data.get("document", {})
+    structured_result = data.get("result", {})
+
+    # OCR text - check multiple possible locations
+    raw_data = structured_result.get("raw", {})
+    ocr_text = raw_data.get("text", "") or structured_result.get("raw_text", "") or ""
+
+    # If still empty, try to get from tables or other sources
+    if not ocr_text and raw_data.get("pages"):
+        # Combine text from all pages
+        page_texts = []
+        for page in raw_data.get("pages", []):
+            if page.get("text"):
+                page_texts.append(page.get("text", ""))
+        ocr_text = "\n\n".join(page_texts)
+
+
+    # HTML preview
+    ocr_html = ocr_text.replace('\n', '<br>')
+    full_html = f"""
         <div style="font-family: Arial, sans-serif; padding: 20px; background: #f5f5f5; border-radius: 8px;">
             <h2 style="color: #333; border-bottom: 2px solid #4CAF50; padding-bottom: 10px;">Document Preview</h2>
             <div style="background: white; padding: 15px; border-radius: 5px; margin-top: 15px; line-height: 1.6;">
@@ -210,74 +302,87 @@ def process_document_via_api(
         </div>
         """
 
-        # Tables HTML - try to use raw HTML tables first, then line items
-        raw_tables = raw_data.get("tables_html", [])
-        line_items = structured_result.get("line_items", [])
-        
-        if raw_tables:
-            # Use the raw HTML tables from the OCR
-            html_tables = "<div style='padding: 10px;'>"
-            for i, table in enumerate(raw_tables):
-                html_tables += f"<h4>Table {i+1}</h4>{table}<br><br>"
-            html_tables += "</div>"
-        elif line_items:
-            html_tables = "<table border='1' style='border-collapse: collapse; width: 100%;'>"
-            html_tables += "<tr style='background: #4CAF50; color: white;'>"
-            html_tables += "<th style='padding: 8px;'>Description</th>"
-            html_tables += "<th style='padding: 8px;'>Quantity</th>"
-            html_tables += "<th style='padding: 8px;'>Unit Price</th>"
-            html_tables += "<th style='padding: 8px;'>Total</th></tr>"
-            for item in line_items:
-                html_tables += f"<tr><td style='padding: 8px;'>{item.get('description', '')}</td>"
-                html_tables += f"<td style='padding: 8px; text-align: center;'>{item.get('quantity', '')}</td>"
-                html_tables += f"<td style='padding: 8px; text-align: right;'>{item.get('unit_price', '')}</td>"
-                html_tables += f"<td style='padding: 8px; text-align: right;'>{item.get('total', '')}</td></tr>"
-            html_tables += "</table>"
-        else:
-            html_tables = "<p>No tables found in document.</p>"
-
-        # CSV tables
-        csv_output = "Description,Quantity,Unit Price,Total\n"
+    # Tables HTML - try to use raw HTML tables first, then line items
+    raw_tables = raw_data.get("tables_html", [])
+    line_items = structured_result.get("line_items", [])
+    extracted_fields = structured_result.get("extracted_fields", {})
+    entities = structured_result.get("entities", [])
+
+    # Pieces are collected in lists and joined once; += would recopy the
+    # growing string for every line item
+    if raw_tables:
+        # Use the raw HTML tables from the OCR
+        parts = ["<div style='padding: 10px;'>"]
+        for i, table in enumerate(raw_tables):
+            parts.append(f"<h4>Table {i+1}</h4>{table}<br><br>")
+        parts.append("</div>")
+        html_tables = "".join(parts)
+    elif line_items:
+        parts = [
+            "<table border='1' style='border-collapse: collapse; width: 100%;'>",
+            "<tr style='background: #4CAF50; color: white;'>",
+            "<th style='padding: 8px;'>Description</th>",
+            "<th style='padding: 8px;'>Quantity</th>",
+            "<th style='padding: 8px;'>Unit Price</th>",
+            "<th style='padding: 8px;'>Total</th></tr>",
+        ]
         for item in line_items:
-            csv_output += f"{item.get('description', '')},{item.get('quantity', '')},{item.get('unit_price', '')},{item.get('total', '')}\n"
-        if not line_items:
-            csv_output = "No tables found."
-
-        # Extract equations, watermarks, images from pages
-        equations_list = []
-        watermarks_list = []
-        images_list = []
-        page_numbers_list = []
-        
-        for page in raw_data.get("pages", []):
-            # Equations (LaTeX)
-            if page.get("latex_equations"):
-                for eq in page.get("latex_equations", []):
-                    equations_list.append(eq)
-            # Watermarks
-            if page.get("watermarks"):
-                for wm in page.get("watermarks", []):
-                    watermarks_list.append(f"Page {page.get('page_number', '?')}: {wm}")
-            # Image descriptions
-            if page.get("image_descriptions"):
-                for i, desc in enumerate(page.get("image_descriptions", [])):
-                    images_list.append(f"Page {page.get('page_number', '?')}, Image {i+1}: {desc}")
-            # Page numbers
-            if page.get("page_numbers_extracted"):
-                for pn in page.get("page_numbers_extracted", []):
-                    page_numbers_list.append(f"Page {page.get('page_number', '?')}: {pn}")
-
-        equations_output = "\n".join(equations_list) if equations_list else "No equations found."
-        watermarks_str = "\n".join(watermarks_list) if watermarks_list else "No watermarks detected."
-        images_str = "\n".join(images_list) if images_list else "No image descriptions found."
-        page_nums_str = "\n".join(page_numbers_list) if page_numbers_list else f"Total Pages: {doc_info.get('total_pages', 1)}"
-
-
-        # JSON output
-        json_output = json.dumps(structured_result, indent=2)
-
-        # XML output (simplified)
-        xml_output = f"""<?xml version="1.0" encoding="UTF-8"?>
+            # Cell values are OCR text, so escape them before embedding
+            parts.append(
+                f"<tr><td style='padding: 8px;'>{html.escape(str(item.get('description', '')))}</td>"
+                f"<td style='padding: 8px; text-align: center;'>{html.escape(str(item.get('quantity', '')))}</td>"
+                f"<td style='padding: 8px; text-align: right;'>{html.escape(str(item.get('unit_price', '')))}</td>"
+                f"<td style='padding: 8px; text-align: right;'>{html.escape(str(item.get('total', '')))}</td></tr>"
+            )
+        parts.append("</table>")
+        html_tables = "".join(parts)
+    else:
+        html_tables = "<p>No tables found in document.</p>"
+
+    # CSV tables
+    if line_items:
+        csv_lines = ["Description,Quantity,Unit Price,Total"]
+        for item in line_items:
+            csv_lines.append(f"{item.get('description', '')},{item.get('quantity', '')},{item.get('unit_price', '')},{item.get('total', '')}")
+        csv_output = "\n".join(csv_lines) + "\n"
+    else:
+        csv_output = "No tables found."
+
+    # Extract equations, watermarks, images from pages
+    equations_list = []
+    watermarks_list = []
+    images_list = []
+    page_numbers_list = []
+
+    for page in raw_data.get("pages", []):
+        # Equations (LaTeX)
+        if page.get("latex_equations"):
+            for eq in page.get("latex_equations", []):
+                equations_list.append(eq)
+        # Watermarks
+        if page.get("watermarks"):
+            for wm in page.get("watermarks", []):
+                watermarks_list.append(f"Page {page.get('page_number', '?')}: {wm}")
+        # Image descriptions
+        if page.get("image_descriptions"):
+            for i, desc in enumerate(page.get("image_descriptions", [])):
+                images_list.append(f"Page {page.get('page_number', '?')}, Image {i+1}: {desc}")
+        # Page numbers
+        if page.get("page_numbers_extracted"):
+            for pn in page.get("page_numbers_extracted", []):
+                page_numbers_list.append(f"Page {page.get('page_number', '?')}: {pn}")
+
+    equations_output = "\n".join(equations_list) if equations_list else "No equations found."
+    watermarks_str = "\n".join(watermarks_list) if watermarks_list else "No watermarks detected."
+    images_str = "\n".join(images_list) if images_list else "No image descriptions found."
+    page_nums_str = "\n".join(page_numbers_list) if page_numbers_list else f"Total Pages: {doc_info.get('total_pages', 1)}"
+
+
+    # JSON output
+    json_output = _dumps_pretty(structured_result)
+
+    # XML output (simplified)
+    xml_output = f"""<?xml version="1.0" encoding="UTF-8"?>
 <document>
     <metadata>
         <filename>{doc_info.get('filename', '')}</filename>
@@ -288,112 +393,108 @@ def process_document_via_api(
     <language>{structured_result.get('language', '')}</language>
     <confidence>{structured_result.get('confidence', 0)}</confidence>
     <extracted_fields>
-        {chr(10).join([f'        <field name="{k}">{v}</field>' for k, v in structured_result.get('extracted_fields', {}).items()])}
+        {chr(10).join([f'        <field name="{k}">{v}</field>' for k, v in extracted_fields.items()])}
     </extracted_fields>
 </document>"""
 
-        # Bounding box visualization - load the uploaded file
-        bbox_image = None
-        try:
-            file_ext = os.path.splitext(file.name)[1].lower()
-            
-            if file_ext in ['.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff']:
-                # Load image directly
-                uploaded_image = Image.open(file.name)
-                if uploaded_image.mode != 'RGB':
-                    uploaded_image = uploaded_image.convert('RGB')
-                bbox_image = create_bounding_box_visualization(uploaded_image, ocr_text)
-                
-            elif file_ext == '.pdf':
-                # Try to extract first page from PDF as image
-                try:
-                    import fitz  # PyMuPDF
-                    pdf_doc = fitz.open(file.name)
-                    if len(pdf_doc) > 0:
-                        page = pdf_doc[0]
-                        # Render at 150 DPI for good quality
-                        mat = fitz.Matrix(150/72, 150/72)
-                        pix = page.get_pixmap(matrix=mat)
-                        # Convert to PIL Image
-                        uploaded_image = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                        bbox_image = create_bounding_box_visualization(uploaded_image, ocr_text)
-                    pdf_doc.close()
-                except ImportError:
-                    # PyMuPDF not available, create a placeholder
-                    placeholder = Image.new('RGB', (800, 600), color=(245, 245, 245))
-                    draw = ImageDraw.Draw(placeholder)
-                    draw.text((50, 280), "PDF Preview: Install PyMuPDF for visualization", fill=(100, 100, 100))
-                    bbox_image = placeholder
-        except Exception as e:
-            # If visualization fails, create error placeholder
-            placeholder = Image.new('RGB', (800, 100), color=(255, 240, 240))
-            draw = ImageDraw.Draw(placeholder)
-            draw.text((10, 40), f"Visualization error: {str(e)[:60]}", fill=(200, 0, 0))
-            bbox_image = placeholder
-
-
-        # API v1 request/response (simulated from v2 data)
-        api_v1_json = json.dumps({
-            "request": {
-                "endpoint": api_endpoint,
-                "method": api_method,
-                "headers": {
-                    "Authorization": f"Bearer {api_key[:8]}{'*' * 8}" if api_key else "Bearer ********",
-                    "Content-Type": "multipart/form-data",
-                },
-                "parameters": {
-                    "confidence_threshold": confidence_threshold,
-                    "output_format": output_format,
-                }
+    # Bounding box visualization - load the uploaded file
+    bbox_image = None
+    try:
+        file_ext = os.path.splitext(file.name)[1].lower()
+
+        if file_ext in ['.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff']:
+            # Load image directly
+            uploaded_image = Image.open(file.name)
+            if uploaded_image.mode != 'RGB':
+                uploaded_image = uploaded_image.convert('RGB')
+            bbox_image = create_bounding_box_visualization(uploaded_image, ocr_text)
+
+        elif file_ext == '.pdf':
+            # Try to extract first page from PDF as image
+            try:
+                import fitz  # PyMuPDF
+                pdf_doc = fitz.open(file.name)
+                if len(pdf_doc) > 0:
+                    page = pdf_doc[0]
+                    # Render at 150 DPI for good quality
+                    mat = fitz.Matrix(150/72, 150/72)
+                    pix = page.get_pixmap(matrix=mat)
+                    # Convert to PIL Image
+                    uploaded_image = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+                    bbox_image = create_bounding_box_visualization(uploaded_image, ocr_text)
+                pdf_doc.close()
+            except ImportError:
+                # PyMuPDF not available, create a placeholder
+                placeholder = Image.new('RGB', (800, 600), color=(245, 245, 245))
+                draw = ImageDraw.Draw(placeholder)
+                draw.text((50, 280), "PDF Preview: Install PyMuPDF for visualization", fill=(100, 100, 100))
+                bbox_image = placeholder
+    except Exception as e:
+        # If visualization fails, create error placeholder
+        placeholder = Image.new('RGB', (800, 100), color=(255, 240, 240))
+        draw = ImageDraw.Draw(placeholder)
+        draw.text((10, 40), f"Visualization error: {str(e)[:60]}", fill=(200, 0, 0))
+        bbox_image = placeholder
+
+
+    # API v1 request/response (simulated from v2 data)
+    api_v1_json = _dumps_pretty({
+        "request": {
+            "endpoint": api_endpoint,
+            "method": api_method,
+            "headers": {
+                "Authorization": f"Bearer {api_key[:8]}{'*' * 8}" if api_key else "Bearer ********",
+                "Content-Type": "multipart/form-data",
             },
-            "response": {
-                "status": "success",
-                "status_code": 200,
-                "processing_time_ms": processing_time_ms,
-                "extracted_fields": structured_result.get("extracted_fields", {})
+            "parameters": {
+                "confidence_threshold": confidence_threshold,
+                "output_format": output_format,
             }
-        }, indent=2)
-
-        # API v2 response
-        api_v2_json = json.dumps(data, indent=2)
-
-        # Webhook payload
-        import uuid
-        import hashlib
-        webhook_payload = {
-            "event": "document.processed",
-            "event_id": str(uuid.uuid4()),
-            "timestamp": datetime.now().isoformat(),
-            "webhook_url": webhook_url if webhook_url else "https://api.example.com/webhooks/ocr",
-            "request_id": data.get("job_id", str(uuid.uuid4())),
-            "status": "completed",
-            "delivery": {
-                "attempt": 1,
-                "max_attempts": 3,
-                "status": "delivered" if webhook_url else "simulated"
-            },
-            "data": {
-                "document_id": data.get("job_id", ""),
-                "document_type": structured_result.get('document_type', ''),
-                "language": structured_result.get('language', ''),
-                "extracted_fields": structured_result.get('extracted_fields', {}),
-                "line_items": line_items[:10],  # Limit for readability
-                "entities": structured_result.get('entities', [])[:10],
-                "metadata": {
-                    "pages": doc_info.get('total_pages', 1),
-                    "processing_time_ms": processing_time_ms,
-                    "confidence": structured_result.get('confidence', 0)
-                }
-            },
-            "signature": f"sha256={hashlib.sha256(json.dumps(structured_result.get('extracted_fields', {})).encode()).hexdigest()[:32]}"
+        },
+        "response": {
+            "status": "success",
+            "status_code": 200,
+            "processing_time_ms": processing_time_ms,
+            "extracted_fields": extracted_fields
         }
-        webhook_json = json.dumps(webhook_payload, indent=2)
+    })
+
+    # API v2 response
+    api_v2_json = _dumps_pretty(data)
+
+    # Webhook payload
+    webhook_payload = {
+        "event": "document.processed",
+        "event_id": str(uuid.uuid4()),
+        "timestamp": datetime.now().isoformat(),
+        "webhook_url": webhook_url if webhook_url else "https://api.example.com/webhooks/ocr",
+        "request_id": data.get("job_id", str(uuid.uuid4())),
+        "status": "completed",
+        "delivery": {
+            "attempt": 1,
+            "max_attempts": 3,
+            "status": "delivered" if webhook_url else "simulated"
+        },
+        "data": {
+            "document_id": data.get("job_id", ""),
+            "document_type": structured_result.get('document_type', ''),
+            "language": structured_result.get('language', ''),
+            "extracted_fields": extracted_fields,
+            "line_items": line_items[:10],  # Limit for readability
+            "entities": entities[:10],
+            "metadata": {
+                "pages": doc_info.get('total_pages', 1),
+                "processing_time_ms": processing_time_ms,
+                "confidence": structured_result.get('confidence', 0)
+            }
+        },
+        "signature": f"sha256={hashlib.sha256(json.dumps(extracted_fields).encode()).hexdigest()[:32]}"
+    }
+    webhook_json = _dumps_pretty(webhook_payload)
 
-        # Statistics
-        extracted_fields = structured_result.get('extracted_fields', {})
-        entities = structured_result.get('entities', [])
-        
-        stats_output = f"""
+    # Statistics
+    fields_found = sum(1 for v in extracted_fields.values() if v)
+    stats_output = f"""
 Processing Statistics:
 
 Document Information:
@@ -415,8 +516,8 @@ Processing Metrics:
 
 Extraction Results:
 - Total Fields: {len(extracted_fields)}
-- Fields Found: {sum(1 for v in extracted_fields.values() if v)}
-- Fields Empty: {sum(1 for v in extracted_fields.values() if not v)}
+- Fields Found: {fields_found}
+- Fields Empty: {len(extracted_fields) - fields_found}
 - Entities Extracted: {len(entities)}
 - Line Items Found: {len(line_items)}
 - Tables Found: {len(raw_tables)}
@@ -435,16 +536,62 @@ API Connection:
 """
 
 
-        return (ocr_text, processing_time, full_html, html_tables,
-                csv_output, equations_output, images_str,
-                watermarks_str, page_nums_str, json_output, xml_output,
-                bbox_image, api_v1_json, api_v2_json, webhook_json, stats_output)
+    return (ocr_text, processing_time, full_html, html_tables,
+            csv_output, equations_output, images_str,
+            watermarks_str, page_nums_str, json_output, xml_output,
+            bbox_image, api_v1_json, api_v2_json, webhook_json, stats_output)
+
+
+async def process_document_via_api_async(
+    file,
+    max_new_tokens, max_image_size,
+    enabled_fields,
+    custom_field_1, custom_field_2, custom_field_3,
+    custom_field_4, custom_field_5, custom_field_6,
+    custom_field_7, custom_field_8, custom_field_9,
+    custom_field_10,
+    api_endpoint, api_key, api_method, webhook_url,
+    confidence_threshold, output_format, enable_batch
+):
+    """
+    Orchestrate OCR via API and format for Gradio output.
+
+    Uploads from concurrent sessions share one pooled async client per
+    endpoint and are capped at MAX_CONCURRENT_UPLOADS; the client retries
+    429/503 with backoff. Formatting runs in a worker thread so image
+    rendering does not block the event loop.
+    """
+
+    if file is None:
+        return _error_outputs("Error: No file provided.")
+
+    try:
+        async with _leased_async_client(api_endpoint, api_key) as client:
+            health = await _cached_health(client)
+            if not health.success:
+                return _error_outputs(f"API Connection Failed: {health.error}")
+
+            async with _get_upload_semaphore():
+                result = await client.process_document_v2(
+                    file.name,
+                    max_tokens=max_new_tokens,
+                    webhook_url=webhook_url if webhook_url else None
+                )
+
+        if not result.success:
+            return _error_outputs(f"Processing Failed: {result.error}")
+
+        return await asyncio.to_thread(
+            _format_outputs,
+            file, result.data,
+            api_endpoint, api_key, api_method, webhook_url,
+            confidence_threshold, output_format
+        )
 
     except Exception as e:
-        import traceback
-        error_msg = f"Error: {str(e)}\n\n{traceback.format_exc()}"
-        return (error_msg, "0:00:00", "", "", "", "", "",
-                "", "", "", "", None, "", "", "", "")
+        # Traceback goes to the log; the UI only shows the message
+        app_logger.exception("Document processing via API failed", error=str(e))
+        return _error_outputs(f"Error: {str(e)}")
 
 
 def create_gradio_interface(default_api_url: str = "http://localhost:8000"):
@@ -647,10 +794,12 @@ def create_gradio_interface(default_api_url: str = "http://localhost:8000"):
                             except Exception as e:
                                 return f"❌ Error: {str(e)}"
                         
+                        # A single health request; skip the queue round-trip
                         test_connection_btn.click(
                             fn=test_connection,
                             inputs=[api_endpoint, api_key],
-                            outputs=[connection_status]
+                            outputs=[connection_status],
+                            queue=False
                         )
 
                     # Webhooks
@@ -706,7 +855,7 @@ def create_gradio_interface(default_api_url: str = "http://localhost:8000"):
 
         # Connect button
         process_button.click(
-            fn=process_document_via_api,
+            fn=process_document_via_api_async,
             inputs=[
                 file_input, max_tokens_slider, max_image_size_slider,
                 field_checkboxes,
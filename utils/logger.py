@@ -6,13 +6,19 @@ import json
 import sys
 import uuid
 import time
-from datetime import datetime
 from typing import Optional, Any, Dict
 from contextvars import ContextVar
-from functools import wraps
+from functools import lru_cache, wraps
 
 from config import settings
 
+# orjson serializes log records several times faster than json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Context variables for request tracking
 request_id_var: ContextVar[str] = ContextVar('request_id', default='')
 user_id_var: ContextVar[str] = ContextVar('user_id', default='')
@@ -22,9 +28,25 @@ tenant_id_var: ContextVar[str] = ContextVar('tenant_id', default='')
 class JSONFormatter(logging.Formatter):
     """Format logs as JSON for structured logging."""
 
-    def format(self, record: logging.LogRecord) -> str:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (epoch second, formatted date and time) of the last record; records
+        # arrive in bursts, so most reuse it instead of calling strftime
+        self._second_cache = (None, "")
+
+    def _timestamp(self, created: float) -> str:
+        """ISO-8601 UTC timestamp from a record's creation time."""
+        second = int(created)
+        cached_second, prefix = self._second_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second_cache = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1_000_000):06d}Z"
+
+    def _log_data(self, record: logging.LogRecord) -> Dict[str, Any]:
+        """Build the JSON object for a record."""
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -49,8 +71,87 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
+        return log_data
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_data = self._log_data(record)
+        if HAS_ORJSON:
+            return orjson.dumps(log_data, option=orjson.OPT_NON_STR_KEYS).decode()
         return json.dumps(log_data)
 
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """Format a record as one UTF-8 encoded JSON line."""
+        if HAS_ORJSON:
+            return orjson.dumps(
+                self._log_data(record), option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+            )
+        return (json.dumps(self._log_data(record)) + "\n").encode("utf-8")
+
+
+# Shared by every handler: formatters hold no per-handler state, and one
+# instance lets all loggers reuse the same cached timestamp prefix
+_JSON_FORMATTER = JSONFormatter()
+
+
+class JSONFileHandler(logging.Handler):
+    """
+    Append JSON log lines to a file, flushing after every record.
+
+    Records are encoded straight to bytes, skipping the text layer's second
+    encode. Each line reaches the file as soon as it is logged, so tail -f
+    sees it and a killed process loses nothing.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.stream = open(path, "ab")
+        self.setFormatter(_JSON_FORMATTER)
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            # handle() already holds self.lock around emit
+            format_bytes = getattr(self.formatter, "format_bytes", None)
+            if format_bytes is not None:
+                line = format_bytes(record)
+            else:
+                line = (self.format(record) + "\n").encode("utf-8")
+            self.stream.write(line)
+            self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        with self.lock:
+            if not self.stream.closed:
+                self.stream.flush()
+
+    def close(self):
+        with self.lock:
+            try:
+                if not self.stream.closed:
+                    self.stream.close()
+            finally:
+                super().close()
+
+
+# One file handler per path, shared by every StructuredLogger, so lines from
+# different loggers go through one lock and one stream; each record is flushed
+# as it is written, so the file shows them in the order they were logged
+_file_handlers: Dict[str, logging.Handler] = {}
+
+
+def _get_file_handler(path: str) -> logging.Handler:
+    """Get the shared handler for a log file, creating it on first use."""
+    handler = _file_handlers.get(path)
+    if handler is None:
+        if settings.logging.format == "json":
+            handler = JSONFileHandler(path)
+        else:
+            handler = logging.FileHandler(path, encoding="utf-8")
+            handler.setFormatter(_JSON_FORMATTER)
+        _file_handlers[path] = handler
+    return handler
+
 
 class StructuredLogger:
     """Logger with structured JSON output and context tracking."""
@@ -65,14 +166,12 @@ class StructuredLogger:
 
         # Add JSON handler
         handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(JSONFormatter())
+        handler.setFormatter(_JSON_FORMATTER)
         self.logger.addHandler(handler)
 
         # Add file handler if configured
         if settings.logging.file_path:
-            file_handler = logging.FileHandler(settings.logging.file_path)
-            file_handler.setFormatter(JSONFormatter())
-            self.logger.addHandler(file_handler)
+            self.logger.addHandler(_get_file_handler(settings.logging.file_path))
 
     def _log(self, level: int, message: str, **kwargs):
         """Log with extra data."""
@@ -115,8 +214,15 @@ logger = app_logger.logger
 
 def setup_logger(name: str = "nanonets-vl", level: str = None) -> logging.Logger:
     """Legacy function for backwards compatibility."""
-    structured = StructuredLogger(name, getattr(logging, (level or "INFO").upper()))
-    return structured.logger
+    configured = _configured_logger(name)
+    configured.setLevel(getattr(logging, (level or "INFO").upper()))
+    return configured
+
+
+@lru_cache(maxsize=64)
+def _configured_logger(name: str) -> logging.Logger:
+    """Attach handlers to a logger once per name; repeat calls reuse them."""
+    return StructuredLogger(name).logger
 
 
 def generate_request_id() -> str: